@@ -29,6 +29,7 @@ from app.models.department import Department  # noqa
 from app.models.employee import Employee  # noqa
 from app.models.project import Project  # noqa
 from app.models.timesheet import Timesheet  # noqa
+from app.models.employee_hours import EmployeeHoursMonthly  # noqa
 
 target_metadata = Base.metadata
 
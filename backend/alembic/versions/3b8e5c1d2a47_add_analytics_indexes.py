@@ -0,0 +1,32 @@
+"""Add analytics indexes
+
+Revision ID: 3b8e5c1d2a47
+Revises: 94f9bd94acf9
+Create Date: 2026-10-15 09:12:44.118203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8e5c1d2a47'
+down_revision = '94f9bd94acf9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_employee_department_id', 'employees', ['department_id'], unique=False)
+    op.create_index('ix_employee_revenue_generated', 'employees', [sa.text('revenue_generated DESC')], unique=False)
+    op.create_index('ix_project_department_id', 'projects', ['department_id'], unique=False)
+    op.create_index('ix_ts_emp_date', 'timesheets', ['employee_id', 'date'], unique=False)
+    op.create_index('ix_ts_project_employee', 'timesheets', ['project_id', 'employee_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ts_project_employee', table_name='timesheets')
+    op.drop_index('ix_ts_emp_date', table_name='timesheets')
+    op.drop_index('ix_project_department_id', table_name='projects')
+    op.drop_index('ix_employee_revenue_generated', table_name='employees')
+    op.drop_index('ix_employee_department_id', table_name='employees')
@@ -0,0 +1,51 @@
+"""Add employee_hours_monthly rollup
+
+Revision ID: 7d2f9a6e4c10
+Revises: 3b8e5c1d2a47
+Create Date: 2026-10-15 10:02:19.540871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2f9a6e4c10'
+down_revision = '3b8e5c1d2a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('employee_hours_monthly',
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('hours', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('employee_id', 'year', 'month')
+    )
+
+    # Backfill from existing timesheets
+    timesheets = sa.table(
+        'timesheets',
+        sa.column('employee_id', sa.Integer()),
+        sa.column('hours_worked', sa.Float()),
+        sa.column('date', sa.Date()),
+    )
+    year = sa.extract('year', timesheets.c.date)
+    month = sa.extract('month', timesheets.c.date)
+    op.execute(
+        sa.table(
+            'employee_hours_monthly',
+            sa.column('employee_id'), sa.column('year'), sa.column('month'), sa.column('hours'),
+        ).insert().from_select(
+            ['employee_id', 'year', 'month', 'hours'],
+            sa.select(timesheets.c.employee_id, year, month, sa.func.sum(timesheets.c.hours_worked))
+            .group_by(timesheets.c.employee_id, year, month),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('employee_hours_monthly')
@@ -0,0 +1,27 @@
+"""Add computed employees.hourly_rate
+
+Revision ID: c41a7e9b5d23
+Revises: 7d2f9a6e4c10
+Create Date: 2026-10-15 11:27:03.862514
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41a7e9b5d23'
+down_revision = '7d2f9a6e4c10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batch mode so SQLite rebuilds the table; it can't ALTER in a stored column
+    with op.batch_alter_table('employees') as batch_op:
+        batch_op.add_column(sa.Column('hourly_rate', sa.Float(), sa.Computed('salary / 160.0', persisted=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('employees') as batch_op:
+        batch_op.drop_column('hourly_rate')
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.v1.dependencies.auth import get_analyst_permission, get_department_head_permission
@@ -8,7 +9,10 @@ from app.db.session import get_db
 from app.models.user import User
 from app.services import analytics_service, department_service, employee_service, project_service
 
-router = APIRouter()
+# Analytics payloads are large, float-heavy dicts; orjson serializes them much faster.
+# Endpoints return the ORJSONResponse themselves, so FastAPI skips response_model
+# validation and jsonable_encoder; response_model only documents the schema.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/company", response_model=Dict)
@@ -19,7 +23,7 @@ def get_company_analytics(
     """
     Get overall company analytics.
     """
-    return analytics_service.get_company_analytics(db)
+    return ORJSONResponse(analytics_service.get_company_analytics(db))
 
 
 @router.get("/departments/{department_id}", response_model=Dict)
@@ -38,7 +42,7 @@ def get_department_analytics(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Department not found",
         )
-    return analytics_service.get_department_analytics(db, department_id)
+    return ORJSONResponse(analytics_service.get_department_analytics(db, department_id))
 
 
 @router.get("/projects/{project_id}", response_model=Dict)
@@ -57,7 +61,7 @@ def get_project_analytics(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    return analytics_service.get_project_analytics(db, project_id)
+    return ORJSONResponse(analytics_service.get_project_analytics(db, project_id))
 
 
 @router.get("/employees/{employee_id}", response_model=Dict)
@@ -76,7 +80,7 @@ def get_employee_analytics(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Employee not found",
         )
-    return analytics_service.get_employee_analytics(db, employee_id)
+    return ORJSONResponse(analytics_service.get_employee_analytics(db, employee_id))
 
 
 @router.get("/top-performers", response_model=List[Dict])
@@ -88,7 +92,7 @@ def get_top_performers(
     """
     Get top performing employees based on revenue generated.
     """
-    return analytics_service.get_top_performers(db, limit)
+    return ORJSONResponse(analytics_service.get_top_performers(db, limit))
 
 
 @router.get("/top-projects", response_model=List[Dict])
@@ -100,4 +104,4 @@ def get_top_projects(
     """
     Get top performing projects based on revenue.
     """
-    return analytics_service.get_top_projects(db, limit)
+    return ORJSONResponse(analytics_service.get_top_projects(db, limit))
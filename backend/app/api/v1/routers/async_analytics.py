@@ -57,7 +57,7 @@ async def get_department_analytics(
                 extra={"user_id": current_user.id, "department_id": department_id})
     
     # Check if department exists
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.get(Department, department_id)
     if not department:
         logger.warning(f"Department not found: department_id={department_id}", 
                       extra={"user_id": current_user.id})
@@ -98,7 +98,7 @@ async def get_employee_analytics(
                 extra={"user_id": current_user.id, "employee_id": employee_id})
     
     # Check if employee exists
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         logger.warning(f"Employee not found: employee_id={employee_id}", 
                       extra={"user_id": current_user.id})
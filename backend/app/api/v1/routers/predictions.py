@@ -30,7 +30,7 @@ def predict_department_performance(
     - AI-generated recommendations
     """
     # Check if department exists
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.get(Department, department_id)
     if not department:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -63,7 +63,7 @@ def train_department_model(
     Manually trigger training of prediction models for a department.
     """
     # Check if department exists
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.get(Department, department_id)
     if not department:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,8 +1,8 @@
 import os
-from typing import Any, Dict
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.v1.dependencies.auth import get_analyst_permission
@@ -12,6 +12,11 @@ from app.services import reports_service
 
 router = APIRouter()
 
+MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
 
 @router.get("/generate", response_class=FileResponse)
 def generate_report(
@@ -45,7 +50,7 @@ def generate_report(
         return FileResponse(
             path=filepath,
             filename=filename,
-            media_type="application/pdf" if report_type.lower() == "pdf" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            media_type=MEDIA_TYPES[report_type.lower()]
         )
     
     except Exception as e:
@@ -53,3 +58,78 @@ def generate_report(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error generating report: {str(e)}",
         )
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+def create_report_job(
+    *,
+    background_tasks: BackgroundTasks,
+    report_type: str = Query(..., description="Type of report to generate: 'pdf', 'excel' or 'both'"),
+    current_user: User = Depends(get_analyst_permission),
+) -> Any:
+    """
+    Start generating a report in the background and return a task id to poll.
+    With 'both', the PDF and Excel files are built concurrently from one fetch of the data.
+    """
+    report_type = report_type.lower()
+    if report_type not in reports_service.REPORT_JOB_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid report type: {report_type}. Use 'pdf', 'excel' or 'both'.",
+        )
+    
+    task_id = reports_service.create_report_job(report_type)
+    background_tasks.add_task(reports_service.run_report_job, task_id)
+    return {"task_id": task_id, "status": "pending"}
+
+
+@router.get("/jobs/{task_id}")
+def read_report_job(
+    *,
+    task_id: str,
+    report_format: Optional[str] = Query(
+        None, alias="format", description="Which file of a 'both' job to download: 'pdf' or 'excel'"
+    ),
+    current_user: User = Depends(get_analyst_permission),
+) -> Any:
+    """
+    Download a background report once it is ready, or return its current status.
+    """
+    job = reports_service.get_report_job(task_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report job not found",
+        )
+    
+    if job["status"] == "failed":
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating report: {job['error']}",
+        )
+    
+    if job["status"] != "completed":
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"task_id": task_id, "status": job["status"]},
+        )
+    
+    files = job["files"]
+    if report_format is None:
+        if len(files) > 1:
+            # Several files; the client picks one with ?format=
+            return {"task_id": task_id, "status": job["status"], "formats": list(files)}
+        report_format = next(iter(files))
+    
+    report = files.get(report_format.lower())
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No {report_format} report for this job",
+        )
+    
+    return FileResponse(
+        path=report["filepath"],
+        filename=report["filename"],
+        media_type=MEDIA_TYPES[report_format.lower()],
+    )
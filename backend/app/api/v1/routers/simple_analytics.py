@@ -64,6 +64,7 @@ def get_department_analytics(
             "project_count": 2,
             "total_salary_cost": 325000.0,
             "total_project_cost": 130000.0,
+            "total_cost": 455000.0,
             "total_revenue": 800000.0,
             "profit": 345000.0,
             "profit_margin": 43.13,
@@ -81,6 +82,7 @@ def get_department_analytics(
             "project_count": 2,
             "total_salary_cost": 175000.0,
             "total_project_cost": 65000.0,
+            "total_cost": 240000.0,
             "total_revenue": 570000.0,
             "profit": 330000.0,
             "profit_margin": 57.89,
@@ -101,6 +103,7 @@ def get_department_analytics(
         "project_count": 2,
         "total_salary_cost": 200000.0,
         "total_project_cost": 50000.0,
+        "total_cost": 250000.0,
         "total_revenue": 400000.0,
         "profit": 150000.0,
         "profit_margin": 37.5,
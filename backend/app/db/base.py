@@ -4,4 +4,5 @@ from app.models.user import User  # noqa
 from app.models.department import Department  # noqa
 from app.models.employee import Employee  # noqa
 from app.models.project import Project  # noqa
-from app.models.timesheet import Timesheet  # noqa
\ No newline at end of file
+from app.models.timesheet import Timesheet  # noqa
+from app.models.employee_hours import EmployeeHoursMonthly  # noqa
\ No newline at end of file
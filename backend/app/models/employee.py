@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Computed, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -12,6 +12,14 @@ class Employee(Base):
     department_id = Column(Integer, ForeignKey("departments.id"), nullable=False)
     salary = Column(Float, nullable=False)
     revenue_generated = Column(Float, default=0.0)
+    # Assuming 160 working hours per month
+    hourly_rate = Column(Float, Computed("salary / 160.0", persisted=True))
+
+    __table_args__ = (
+        Index("ix_employee_department_id", department_id),
+        # Lets get_top_performers read rows in ORDER BY order
+        Index("ix_employee_revenue_generated", revenue_generated.desc()),
+    )
 
     # Relationships
     department = relationship("Department", back_populates="employees")
@@ -0,0 +1,97 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import Column, Float, ForeignKey, Integer, delete, event, extract, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm.attributes import get_history
+
+from app.db.base_class import Base
+from app.models.timesheet import Timesheet
+
+
+class EmployeeHoursMonthly(Base):
+    """Per-employee monthly hours rollup, maintained from Timesheet writes."""
+    __tablename__ = "employee_hours_monthly"
+
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    hours = Column(Float, nullable=False, default=0.0)
+
+
+def apply_hours_deltas(connection: Connection, deltas: Iterable[Tuple[int, date, float]]) -> None:
+    """Add (employee_id, day, hours) deltas to the rollup with an upsert."""
+    # Collapse to one row per key; batched upserts can't touch a row twice
+    totals: Dict[Tuple[int, int, int], float] = defaultdict(float)
+    for employee_id, day, hours in deltas:
+        totals[(employee_id, day.year, day.month)] += hours
+    rows = [
+        {"employee_id": employee_id, "year": year, "month": month, "hours": hours}
+        for (employee_id, year, month), hours in totals.items()
+        if hours
+    ]
+    if not rows:
+        return
+
+    insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    table = EmployeeHoursMonthly.__table__
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.employee_id, table.c.year, table.c.month],
+        set_={"hours": table.c.hours + stmt.excluded.hours},
+    )
+    connection.execute(stmt, rows)
+
+
+def rebuild_hours_rollup(connection: Connection) -> None:
+    """Recompute the whole rollup from the timesheets table."""
+    table = EmployeeHoursMonthly.__table__
+    timesheets = Timesheet.__table__
+    year = extract("year", timesheets.c.date)
+    month = extract("month", timesheets.c.date)
+    connection.execute(delete(table))
+    connection.execute(insert(table).from_select(
+        ["employee_id", "year", "month", "hours"],
+        select(timesheets.c.employee_id, year, month, func.sum(timesheets.c.hours_worked))
+        .group_by(timesheets.c.employee_id, year, month),
+    ))
+
+
+def _timesheet_day(value) -> date:
+    return value or date.today()
+
+
+def _load_previous_value(target, value, oldvalue, initiator) -> None:
+    # No-op: registering any "set" listener with active_history=True makes the
+    # ORM load the previous value on set, even for expired instances, so
+    # updates can subtract the old hours from the right month
+    pass
+
+
+for _attr in (Timesheet.employee_id, Timesheet.hours_worked, Timesheet.date):
+    event.listen(_attr, "set", _load_previous_value, active_history=True)
+
+
+@event.listens_for(Timesheet, "after_insert")
+def _timesheet_inserted(mapper, connection, target) -> None:
+    apply_hours_deltas(connection, [(target.employee_id, _timesheet_day(target.date), target.hours_worked)])
+
+
+@event.listens_for(Timesheet, "after_update")
+def _timesheet_updated(mapper, connection, target) -> None:
+    def old_value(attr):
+        history = get_history(target, attr)
+        return history.deleted[0] if history.deleted else getattr(target, attr)
+
+    apply_hours_deltas(connection, [
+        (old_value("employee_id"), _timesheet_day(old_value("date")), -old_value("hours_worked")),
+        (target.employee_id, _timesheet_day(target.date), target.hours_worked),
+    ])
+
+
+@event.listens_for(Timesheet, "after_delete")
+def _timesheet_deleted(mapper, connection, target) -> None:
+    apply_hours_deltas(connection, [(target.employee_id, _timesheet_day(target.date), -target.hours_worked)])
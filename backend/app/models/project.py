@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -13,6 +13,10 @@ class Project(Base):
     cost = Column(Float, nullable=False, default=0.0)
     revenue = Column(Float, nullable=False, default=0.0)
 
+    __table_args__ = (
+        Index("ix_project_department_id", department_id),
+    )
+
     # Relationships
     department = relationship("Department", back_populates="projects")
     timesheets = relationship("Timesheet", back_populates="project", cascade="all, delete-orphan")
@@ -1,5 +1,5 @@
 from datetime import date
-from sqlalchemy import Column, Date, Float, ForeignKey, Integer
+from sqlalchemy import Column, Date, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -14,6 +14,11 @@ class Timesheet(Base):
     hours_worked = Column(Float, nullable=False)
     date = Column(Date, nullable=False, default=date.today)
 
+    __table_args__ = (
+        Index("ix_ts_emp_date", employee_id, date),
+        Index("ix_ts_project_employee", project_id, employee_id),
+    )
+
     # Relationships
     employee = relationship("Employee", back_populates="timesheets")
     project = relationship("Project", back_populates="timesheets")
@@ -1,11 +1,14 @@
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+import calendar
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any, Union
 
-from sqlalchemy import func
+from sqlalchemy import Row, case, distinct, func, select
 from sqlalchemy.orm import Session
 
 from app.models.department import Department
 from app.models.employee import Employee
+from app.models.employee_hours import EmployeeHoursMonthly
 from app.models.project import Project
 from app.models.timesheet import Timesheet
 
@@ -31,40 +34,132 @@ def calculate_productivity_index(total_revenue: float, total_hours: float) -> fl
     return total_revenue / total_hours
 
 
+@lru_cache(maxsize=8)
+def _month_context(today: date) -> Tuple[date, int]:
+    """Return (start_of_month, expected_hours) for the month containing today."""
+    # Assuming 8 hours per day, 5 days per week
+    days_in_month = calendar.monthrange(today.year, today.month)[1]
+    working_days = sum(
+        1 for day in range(1, days_in_month + 1)
+        if date(today.year, today.month, day).weekday() < 5  # 0-4 are Monday to Friday
+    )
+    return today.replace(day=1), working_days * 8
+
+
 def get_department_analytics(db: Session, department_id: int) -> Dict[str, Any]:
     """Get analytics for a specific department."""
     # Get department
-    department = db.query(Department).filter(Department.id == department_id).first()
+    department = db.get(Department, department_id)
     if not department:
         return {}
     
-    # Get employees in department
-    employees = db.query(Employee).filter(Employee.department_id == department_id).all()
-    employee_count = len(employees)
-    
-    # Calculate total salary cost
-    total_salary = db.query(func.sum(Employee.salary)).filter(
-        Employee.department_id == department_id
-    ).scalar() or 0.0
-    
-    # Calculate total revenue generated
-    total_revenue = db.query(func.sum(Employee.revenue_generated)).filter(
+    # Count employees and total their salary cost and revenue generated
+    employee_count, total_salary, total_revenue = db.query(
+        func.count(Employee.id),
+        func.coalesce(func.sum(Employee.salary), 0.0),
+        func.coalesce(func.sum(Employee.revenue_generated), 0.0),
+    ).filter(Employee.department_id == department_id).one()
+    
+    # Count projects and total their cost and revenue
+    project_count, total_project_cost, total_project_revenue = db.query(
+        func.count(Project.id),
+        func.coalesce(func.sum(Project.cost), 0.0),
+        func.coalesce(func.sum(Project.revenue), 0.0),
+    ).filter(Project.department_id == department_id).one()
+    
+    # Calculate total hours logged by the department's employees
+    total_hours = db.query(func.sum(Timesheet.hours_worked)).join(Employee).filter(
         Employee.department_id == department_id
     ).scalar() or 0.0
     
-    # Get projects in department
-    projects = db.query(Project).filter(Project.department_id == department_id).all()
-    project_count = len(projects)
-    
-    # Calculate total project cost and revenue
-    total_project_cost = db.query(func.sum(Project.cost)).filter(
-        Project.department_id == department_id
-    ).scalar() or 0.0
-    
-    total_project_revenue = db.query(func.sum(Project.revenue)).filter(
-        Project.department_id == department_id
-    ).scalar() or 0.0
+    return _build_department_analytics(
+        department, employee_count, total_salary, total_revenue,
+        project_count, total_project_cost, total_project_revenue, total_hours
+    )
+
+
+def get_all_department_analytics(db: Session) -> Dict[int, Dict[str, Any]]:
+    """Get analytics for every department, keyed by department id."""
+    # One grouped query per table instead of a round of queries per department
+    employee_totals = {
+        row[0]: row[1:] for row in db.query(
+            Employee.department_id,
+            func.count(Employee.id),
+            func.coalesce(func.sum(Employee.salary), 0.0),
+            func.coalesce(func.sum(Employee.revenue_generated), 0.0),
+        ).group_by(Employee.department_id)
+    }
+    project_totals = {
+        row[0]: row[1:] for row in db.query(
+            Project.department_id,
+            func.count(Project.id),
+            func.coalesce(func.sum(Project.cost), 0.0),
+            func.coalesce(func.sum(Project.revenue), 0.0),
+        ).group_by(Project.department_id)
+    }
+    hours_totals = dict(
+        db.query(Employee.department_id, func.sum(Timesheet.hours_worked))
+        .select_from(Timesheet)
+        .join(Employee)
+        .group_by(Employee.department_id)
+        .all()
+    )
     
+    return {
+        department.id: _build_department_analytics(
+            department,
+            *employee_totals.get(department.id, (0, 0.0, 0.0)),
+            *project_totals.get(department.id, (0, 0.0, 0.0)),
+            hours_totals.get(department.id) or 0.0,
+        )
+        for department in db.execute(select(Department.id, Department.name, Department.budget))
+    }
+
+
+def get_departments_by_roi_threshold(
+    db: Session, lt: Optional[float] = None, gt: Optional[float] = None
+) -> List[str]:
+    """Names of departments whose ROI is below lt and/or above gt, computed in SQL."""
+    employee_totals = db.query(
+        Employee.department_id.label("department_id"),
+        func.sum(Employee.salary).label("salary"),
+        func.sum(Employee.revenue_generated).label("revenue"),
+    ).group_by(Employee.department_id).subquery()
+    project_totals = db.query(
+        Project.department_id.label("department_id"),
+        func.sum(Project.cost).label("cost"),
+        func.sum(Project.revenue).label("revenue"),
+    ).group_by(Project.department_id).subquery()
+    
+    # Same formula as calculate_department_roi, including 0 for departments without costs
+    total_cost = func.coalesce(employee_totals.c.salary, 0.0) + func.coalesce(project_totals.c.cost, 0.0)
+    total_revenue = func.coalesce(employee_totals.c.revenue, 0.0) + func.coalesce(project_totals.c.revenue, 0.0)
+    roi = case((total_cost > 0, (total_revenue - total_cost) / total_cost), else_=0.0)
+    
+    query = db.query(Department.name).outerjoin(
+        employee_totals, employee_totals.c.department_id == Department.id
+    ).outerjoin(
+        project_totals, project_totals.c.department_id == Department.id
+    )
+    if lt is not None:
+        query = query.filter(roi < lt)
+    if gt is not None:
+        query = query.filter(roi > gt)
+    
+    return [name for name, in query.order_by(Department.id)]
+
+
+def _build_department_analytics(
+    department: Union[Department, Row],
+    employee_count: int,
+    total_salary: float,
+    total_revenue: float,
+    project_count: int,
+    total_project_cost: float,
+    total_project_revenue: float,
+    total_hours: float,
+) -> Dict[str, Any]:
+    """Derive the department analytics payload from its aggregated totals."""
     # Calculate profit and profit margin
     total_department_revenue = total_revenue + total_project_revenue
     total_department_cost = total_salary + total_project_cost
@@ -78,10 +173,6 @@ def get_department_analytics(db: Session, department_id: int) -> Dict[str, Any]:
     department_roi = calculate_department_roi(total_department_revenue, total_department_cost)
     
     # Calculate productivity index
-    total_hours = db.query(func.sum(Timesheet.hours_worked)).join(Employee).filter(
-        Employee.department_id == department_id
-    ).scalar() or 0.0
-    
     productivity_index = calculate_productivity_index(total_department_revenue, total_hours)
     
     # Generate alerts
@@ -101,6 +192,7 @@ def get_department_analytics(db: Session, department_id: int) -> Dict[str, Any]:
         "project_count": project_count,
         "total_salary_cost": total_salary,
         "total_project_cost": total_project_cost,
+        "total_cost": total_department_cost,
         "total_revenue": total_department_revenue,
         "profit": profit,
         "profit_margin": profit_margin,
@@ -115,40 +207,69 @@ def get_department_analytics(db: Session, department_id: int) -> Dict[str, Any]:
 def get_project_analytics(db: Session, project_id: int) -> Dict:
     """Get analytics for a specific project."""
     # Get project
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         return {}
     
     # Get department
-    department = db.query(Department).filter(Department.id == project.department_id).first()
-    
-    # Get timesheets for project
-    timesheets = db.query(Timesheet).filter(Timesheet.project_id == project_id).all()
+    department = db.get(Department, project.department_id)
     
     # Calculate total hours worked
     total_hours = db.query(func.sum(Timesheet.hours_worked)).filter(
         Timesheet.project_id == project_id
     ).scalar() or 0.0
     
-    # Get unique employees who worked on the project
-    unique_employees = db.query(Employee).join(Timesheet).filter(
+    # Calculate labor cost and headcount of employees who worked on the project
+    total_employee_cost, employee_count = db.query(
+        func.sum(Employee.hourly_rate * Timesheet.hours_worked),
+        func.count(distinct(Employee.id))
+    ).join(Timesheet).filter(
         Timesheet.project_id == project_id
-    ).distinct().all()
+    ).one()
     
-    employee_count = len(unique_employees)
-    
-    # Calculate average hourly cost
-    total_employee_cost = 0.0
-    for employee in unique_employees:
-        employee_hours = db.query(func.sum(Timesheet.hours_worked)).filter(
-            Timesheet.project_id == project_id,
-            Timesheet.employee_id == employee.id
-        ).scalar() or 0.0
-        
-        # Assuming 160 working hours per month
-        hourly_rate = employee.salary / 160
-        total_employee_cost += hourly_rate * employee_hours
+    return _build_project_analytics(
+        project, department.name if department else "",
+        total_hours, total_employee_cost or 0.0, employee_count
+    )
+
+
+def get_all_project_analytics(db: Session) -> Dict[int, Dict[str, Any]]:
+    """Get analytics for every project, keyed by project id."""
+    department_names = dict(db.query(Department.id, Department.name).all())
+    hours_totals = dict(
+        db.query(Timesheet.project_id, func.sum(Timesheet.hours_worked))
+        .group_by(Timesheet.project_id)
+        .all()
+    )
+    labor_totals = {
+        row[0]: row[1:] for row in db.query(
+            Timesheet.project_id,
+            func.sum(Employee.hourly_rate * Timesheet.hours_worked),
+            func.count(distinct(Employee.id)),
+        ).select_from(Employee).join(Timesheet).group_by(Timesheet.project_id)
+    }
     
+    analytics = {}
+    projects = db.execute(select(
+        Project.id, Project.name, Project.department_id, Project.cost, Project.revenue
+    ))
+    for project in projects:
+        total_employee_cost, employee_count = labor_totals.get(project.id, (None, 0))
+        analytics[project.id] = _build_project_analytics(
+            project, department_names.get(project.department_id, ""),
+            hours_totals.get(project.id) or 0.0, total_employee_cost or 0.0, employee_count
+        )
+    return analytics
+
+
+def _build_project_analytics(
+    project: Union[Project, Row],
+    department_name: str,
+    total_hours: float,
+    total_employee_cost: float,
+    employee_count: int,
+) -> Dict[str, Any]:
+    """Derive the project analytics payload from its aggregated totals."""
     # Calculate profit and profit margin
     total_cost = project.cost + total_employee_cost
     profit = project.revenue - total_cost
@@ -158,7 +279,7 @@ def get_project_analytics(db: Session, project_id: int) -> Dict:
         "project_id": project.id,
         "project_name": project.name,
         "department_id": project.department_id,
-        "department_name": department.name if department else "",
+        "department_name": department_name,
         "cost": project.cost,
         "labor_cost": total_employee_cost,
         "total_cost": total_cost,
@@ -173,32 +294,86 @@ def get_project_analytics(db: Session, project_id: int) -> Dict:
 def get_employee_analytics(db: Session, employee_id: int) -> Dict[str, Any]:
     """Get analytics for a specific employee."""
     # Get employee
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = db.get(Employee, employee_id)
     if not employee:
         return {}
     
     # Get department
-    department = db.query(Department).filter(Department.id == employee.department_id).first()
-    
-    # Get timesheets for employee
-    timesheets = db.query(Timesheet).filter(Timesheet.employee_id == employee_id).all()
+    department = db.get(Department, employee.department_id)
     
     # Calculate total hours worked
     total_hours = db.query(func.sum(Timesheet.hours_worked)).filter(
         Timesheet.employee_id == employee_id
     ).scalar() or 0.0
     
-    # Get unique projects the employee worked on
-    unique_projects = db.query(Project).join(Timesheet).filter(
+    # Count unique projects the employee worked on
+    project_count = db.query(func.count(distinct(Project.id))).join(Timesheet).filter(
         Timesheet.employee_id == employee_id
-    ).distinct().all()
+    ).scalar()
+    
+    # Hours logged this month, read from the monthly rollup
+    start_of_month, _ = _month_context(date.today())
+    hours_this_month = db.query(EmployeeHoursMonthly.hours).filter(
+        EmployeeHoursMonthly.employee_id == employee_id,
+        EmployeeHoursMonthly.year == start_of_month.year,
+        EmployeeHoursMonthly.month == start_of_month.month
+    ).scalar() or 0.0
     
-    project_count = len(unique_projects)
+    return _build_employee_analytics(
+        employee, department.name if department else "",
+        total_hours, project_count, hours_this_month
+    )
+
+
+def get_all_employee_analytics(db: Session) -> Dict[int, Dict[str, Any]]:
+    """Get analytics for every employee, keyed by employee id."""
+    start_of_month, _ = _month_context(date.today())
+    
+    department_names = dict(db.query(Department.id, Department.name).all())
+    hours_totals = dict(
+        db.query(Timesheet.employee_id, func.sum(Timesheet.hours_worked))
+        .group_by(Timesheet.employee_id)
+        .all()
+    )
+    project_counts = dict(
+        db.query(Timesheet.employee_id, func.count(distinct(Project.id)))
+        .select_from(Project)
+        .join(Timesheet)
+        .group_by(Timesheet.employee_id)
+        .all()
+    )
+    month_hours = dict(
+        db.query(EmployeeHoursMonthly.employee_id, EmployeeHoursMonthly.hours).filter(
+            EmployeeHoursMonthly.year == start_of_month.year,
+            EmployeeHoursMonthly.month == start_of_month.month
+        ).all()
+    )
     
+    return {
+        employee.id: _build_employee_analytics(
+            employee,
+            department_names.get(employee.department_id, ""),
+            hours_totals.get(employee.id) or 0.0,
+            project_counts.get(employee.id, 0),
+            month_hours.get(employee.id) or 0.0,
+        )
+        for employee in db.execute(select(
+            Employee.id, Employee.name, Employee.department_id,
+            Employee.salary, Employee.revenue_generated, Employee.hourly_rate,
+        ))
+    }
+
+
+def _build_employee_analytics(
+    employee: Union[Employee, Row],
+    department_name: str,
+    total_hours: float,
+    project_count: int,
+    hours_this_month: float,
+) -> Dict[str, Any]:
+    """Derive the employee analytics payload from its aggregated totals."""
     # Calculate productivity metrics
-    # Assuming 160 working hours per month
-    hourly_rate = employee.salary / 160
-    cost_per_hour = hourly_rate
+    cost_per_hour = employee.hourly_rate
     revenue_per_hour = employee.revenue_generated / total_hours if total_hours > 0 else 0
     profit_per_hour = revenue_per_hour - cost_per_hour
     
@@ -209,26 +384,7 @@ def get_employee_analytics(db: Session, employee_id: int) -> Dict[str, Any]:
     productivity_index = calculate_productivity_index(employee.revenue_generated, total_hours)
     
     # Calculate utilization (hours logged vs. expected hours)
-    # Assuming 8 hours per day, 5 days per week
-    current_date = datetime.now().date()
-    start_of_month = date(current_date.year, current_date.month, 1)
-    days_in_month = (date(current_date.year, current_date.month + 1, 1) - timedelta(days=1)).day
-    
-    # Count working days (excluding weekends)
-    working_days = 0
-    for day in range(1, days_in_month + 1):
-        current_day = date(current_date.year, current_date.month, day)
-        if current_day.weekday() < 5:  # 0-4 are Monday to Friday
-            working_days += 1
-    
-    expected_hours = working_days * 8
-    
-    # Calculate hours logged this month
-    hours_this_month = db.query(func.sum(Timesheet.hours_worked)).filter(
-        Timesheet.employee_id == employee_id,
-        Timesheet.date >= start_of_month
-    ).scalar() or 0.0
-    
+    _, expected_hours = _month_context(date.today())
     utilization_rate = (hours_this_month / expected_hours) * 100 if expected_hours > 0 else 0
     
     # Generate alerts
@@ -244,7 +400,7 @@ def get_employee_analytics(db: Session, employee_id: int) -> Dict[str, Any]:
         "employee_id": employee.id,
         "employee_name": employee.name,
         "department_id": employee.department_id,
-        "department_name": department.name if department else "",
+        "department_name": department_name,
         "salary": employee.salary,
         "revenue_generated": employee.revenue_generated,
         "profit": employee.revenue_generated - employee.salary,
@@ -262,16 +418,29 @@ def get_employee_analytics(db: Session, employee_id: int) -> Dict[str, Any]:
 
 def get_company_analytics(db: Session) -> Dict[str, Any]:
     """Get overall company analytics."""
+    # The per-table rollups are independent, so fetch them as scalar subqueries in one round trip
+    totals = db.query(
+        select(func.count(Department.id)).scalar_subquery().label("department_count"),
+        select(func.sum(Department.budget)).scalar_subquery().label("total_budget"),
+        select(func.count(Employee.id)).scalar_subquery().label("employee_count"),
+        select(func.sum(Employee.salary)).scalar_subquery().label("total_salary"),
+        select(func.sum(Employee.revenue_generated)).scalar_subquery().label("total_employee_revenue"),
+        select(func.count(Project.id)).scalar_subquery().label("project_count"),
+        select(func.sum(Project.cost)).scalar_subquery().label("total_project_cost"),
+        select(func.sum(Project.revenue)).scalar_subquery().label("total_project_revenue"),
+        select(func.sum(Timesheet.hours_worked)).scalar_subquery().label("total_hours"),
+    ).one()
+    
     # Get counts
-    department_count = db.query(func.count(Department.id)).scalar() or 0
-    employee_count = db.query(func.count(Employee.id)).scalar() or 0
-    project_count = db.query(func.count(Project.id)).scalar() or 0
+    department_count = totals.department_count or 0
+    employee_count = totals.employee_count or 0
+    project_count = totals.project_count or 0
     
     # Calculate financial metrics
-    total_salary = db.query(func.sum(Employee.salary)).scalar() or 0.0
-    total_project_cost = db.query(func.sum(Project.cost)).scalar() or 0.0
-    total_employee_revenue = db.query(func.sum(Employee.revenue_generated)).scalar() or 0.0
-    total_project_revenue = db.query(func.sum(Project.revenue)).scalar() or 0.0
+    total_salary = totals.total_salary or 0.0
+    total_project_cost = totals.total_project_cost or 0.0
+    total_employee_revenue = totals.total_employee_revenue or 0.0
+    total_project_revenue = totals.total_project_revenue or 0.0
     
     total_cost = total_salary + total_project_cost
     total_revenue = total_employee_revenue + total_project_revenue
@@ -279,11 +448,11 @@ def get_company_analytics(db: Session) -> Dict[str, Any]:
     profit_margin = (profit / total_revenue) * 100 if total_revenue > 0 else 0
     
     # Calculate total budget across all departments
-    total_budget = db.query(func.sum(Department.budget)).scalar() or 0.0
+    total_budget = totals.total_budget or 0.0
     budget_utilization = (total_cost / total_budget) * 100 if total_budget > 0 else 0
     
     # Calculate productivity metrics
-    total_hours = db.query(func.sum(Timesheet.hours_worked)).scalar() or 0.0
+    total_hours = totals.total_hours or 0.0
     revenue_per_hour = total_revenue / total_hours if total_hours > 0 else 0
     
     # Calculate ROI
@@ -325,22 +494,31 @@ def get_company_analytics(db: Session) -> Dict[str, Any]:
 
 def get_top_performers(db: Session, limit: int = 5) -> List[Dict]:
     """Get top performing employees based on revenue generated."""
-    top_employees = db.query(Employee).order_by(Employee.revenue_generated.desc()).limit(limit).all()
+    top_employees = db.query(
+        Employee.id,
+        Employee.name,
+        Employee.department_id,
+        func.coalesce(Department.name, "").label("department_name"),
+        Employee.revenue_generated,
+        Employee.salary,
+    ).outerjoin(Department, Employee.department_id == Department.id).order_by(
+        Employee.revenue_generated.desc()
+    ).limit(limit).all()
     
     result = []
     for employee in top_employees:
-        department = db.query(Department).filter(Department.id == employee.department_id).first()
+        revenue_generated = employee.revenue_generated or 0.0
         
         # Calculate profit
-        profit = employee.revenue_generated - employee.salary
-        profit_margin = (profit / employee.revenue_generated) * 100 if employee.revenue_generated > 0 else 0
+        profit = revenue_generated - employee.salary
+        profit_margin = (profit / revenue_generated) * 100 if revenue_generated > 0 else 0.0
         
         result.append({
             "employee_id": employee.id,
             "employee_name": employee.name,
             "department_id": employee.department_id,
-            "department_name": department.name if department else "",
-            "revenue_generated": employee.revenue_generated,
+            "department_name": employee.department_name,
+            "revenue_generated": revenue_generated,
             "salary": employee.salary,
             "profit": profit,
             "profit_margin": profit_margin
@@ -351,21 +529,28 @@ def get_top_performers(db: Session, limit: int = 5) -> List[Dict]:
 
 def get_top_projects(db: Session, limit: int = 5) -> List[Dict]:
     """Get top performing projects based on revenue."""
-    top_projects = db.query(Project).order_by(Project.revenue.desc()).limit(limit).all()
+    top_projects = db.query(
+        Project.id,
+        Project.name,
+        Project.department_id,
+        func.coalesce(Department.name, "").label("department_name"),
+        Project.revenue,
+        Project.cost,
+    ).outerjoin(Department, Project.department_id == Department.id).order_by(
+        Project.revenue.desc()
+    ).limit(limit).all()
     
     result = []
     for project in top_projects:
-        department = db.query(Department).filter(Department.id == project.department_id).first()
-        
         # Calculate profit
         profit = project.revenue - project.cost
-        profit_margin = (profit / project.revenue) * 100 if project.revenue > 0 else 0
+        profit_margin = (profit / project.revenue) * 100 if project.revenue > 0 else 0.0
         
         result.append({
             "project_id": project.id,
             "project_name": project.name,
             "department_id": project.department_id,
-            "department_name": department.name if department else "",
+            "department_name": project.department_name,
             "revenue": project.revenue,
             "cost": project.cost,
             "profit": profit,
@@ -6,7 +6,7 @@ from app.models.department import Department
 
 
 def get(db: Session, department_id: int) -> Optional[Department]:
-    return db.query(Department).filter(Department.id == department_id).first()
+    return db.get(Department, department_id)
 
 
 def get_by_name(db: Session, name: str) -> Optional[Department]:
@@ -43,7 +43,7 @@ def update(
 
 
 def remove(db: Session, *, department_id: int) -> Department:
-    obj = db.query(Department).get(department_id)
+    obj = db.get(Department, department_id)
     db.delete(obj)
     db.commit()
     return obj
@@ -6,7 +6,7 @@ from app.models.employee import Employee
 
 
 def get(db: Session, employee_id: int) -> Optional[Employee]:
-    return db.query(Employee).filter(Employee.id == employee_id).first()
+    return db.get(Employee, employee_id)
 
 
 def get_multi(
@@ -47,7 +47,7 @@ def update(
 
 
 def remove(db: Session, *, employee_id: int) -> Employee:
-    obj = db.query(Employee).get(employee_id)
+    obj = db.get(Employee, employee_id)
     db.delete(obj)
     db.commit()
     return obj
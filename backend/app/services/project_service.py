@@ -6,7 +6,7 @@ from app.models.project import Project
 
 
 def get(db: Session, project_id: int) -> Optional[Project]:
-    return db.query(Project).filter(Project.id == project_id).first()
+    return db.get(Project, project_id)
 
 
 def get_multi(
@@ -47,7 +47,7 @@ def update(
 
 
 def remove(db: Session, *, project_id: int) -> Project:
-    obj = db.query(Project).get(project_id)
+    obj = db.get(Project, project_id)
     db.delete(obj)
     db.commit()
     return obj
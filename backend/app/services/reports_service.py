@@ -1,27 +1,84 @@
-import io
+import json
 import os
+import string
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any, BinaryIO
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 import pandas as pd
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.units import inch
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.utils import get_column_letter
+import xlsxwriter
 from sqlalchemy.orm import Session
 
-from app.models.department import Department
-from app.models.employee import Employee
-from app.models.project import Project
-from app.models.timesheet import Timesheet
+from app.db.session import SessionLocal
 from app.services import analytics_service
 
 
+# Styles are shared by every PDF report, so build them once
+_STYLES = getSampleStyleSheet()
+
+_COMPANY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (1, 0), 12),
+    ('BACKGROUND', (0, 1), (1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+])
+
+_DEPT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+])
+
+_EMP_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
+])
+
+_EXCEL_HEADER_FORMAT = {"bold": True, "align": "center", "pattern": 1, "bg_color": "#DDDDDD"}
+
+
+def format_currency(value: float) -> str:
+    """Format an amount as dollars with thousands separators, e.g. $1,234.50."""
+    return f"${value:,.2f}"
+
+
+def _formatted_table(
+    frame: pd.DataFrame, columns: List[Tuple[str, str, Optional[Callable[[Any], str]]]]
+) -> List[List[Any]]:
+    """Header row plus data rows for a PDF table, formatting each column in one map pass."""
+    frame = frame.reindex(columns=[key for _, key, _ in columns])
+    formatted = pd.DataFrame({
+        header: frame[key].map(formatter) if formatter else frame[key]
+        for header, key, formatter in columns
+    }, columns=[header for header, _, _ in columns])
+    return [formatted.columns.tolist()] + formatted.values.tolist()
+
+
 def create_report_directory() -> str:
     """Create directory for storing reports if it doesn't exist."""
     reports_dir = os.path.join(os.getcwd(), "reports")
@@ -30,26 +87,57 @@ def create_report_directory() -> str:
     return reports_dir
 
 
-def generate_pdf_report(db: Session) -> Tuple[str, str]:
-    """Generate a PDF report with department ROI summary, employee productivity, and insights."""
+def _report_file(extension: str) -> Tuple[str, str]:
+    """Return a unique (filename, filepath) for a new report in the reports directory."""
     # Create reports directory
     reports_dir = create_report_directory()
     
-    # Generate unique filename
+    # Generate unique filename; the uuid keeps reports started in the same second,
+    # possibly by different workers, from overwriting each other
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"productivity_report_{timestamp}.pdf"
-    filepath = os.path.join(reports_dir, filename)
-    
-    # Create PDF document
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    filename = f"productivity_report_{timestamp}_{uuid.uuid4().hex}.{extension}"
+    return filename, os.path.join(reports_dir, filename)
+
+
+def _fetch_report_data(db: Session, formats: Tuple[str, ...]) -> Dict[str, Any]:
+    """Fetch the analytics the requested report formats need, once for all of them."""
+    data = {
+        "company": analytics_service.get_company_analytics(db),
+        "departments": analytics_service.get_all_department_analytics(db),
+    }
+    if "pdf" in formats:
+        data["top_employees"] = analytics_service.get_top_performers(db, limit=10)
+        data["low_roi_departments"] = analytics_service.get_departments_by_roi_threshold(db, lt=0.0)
+        data["high_roi_departments"] = analytics_service.get_departments_by_roi_threshold(db, gt=1.0)  # ROI > 100%
+    if "excel" in formats:
+        data["employees"] = analytics_service.get_all_employee_analytics(db)
+        data["projects"] = analytics_service.get_all_project_analytics(db)
+    return data
+
+
+def generate_pdf_report(db: Session) -> Tuple[str, str]:
+    """Generate a PDF report with department ROI summary, employee productivity, and insights."""
+    filename, filepath = _report_file("pdf")
+    _build_pdf(_fetch_report_data(db, ("pdf",)), filepath)
+    return filename, filepath
+
+
+def _build_pdf(data: Dict[str, Any], filepath: str) -> None:
+    """Write the PDF report for pre-fetched report data."""
+    company_data = data["company"]
+    dept_analytics = data["departments"]
+    top_employees = data["top_employees"]
+    low_roi_depts = data["low_roi_departments"]
+    high_roi_depts = data["high_roi_departments"]
+    
+    # Create PDF document, written straight to the report file
+    doc = SimpleDocTemplate(filepath, pagesize=letter)
     elements = []
     
     # Styles
-    styles = getSampleStyleSheet()
-    title_style = styles["Title"]
-    heading_style = styles["Heading2"]
-    normal_style = styles["Normal"]
+    title_style = _STYLES["Title"]
+    heading_style = _STYLES["Heading2"]
+    normal_style = _STYLES["Normal"]
     
     # Add title
     elements.append(Paragraph("Employee Productivity and Cost Analysis Report", title_style))
@@ -57,7 +145,6 @@ def generate_pdf_report(db: Session) -> Tuple[str, str]:
     elements.append(Spacer(1, 0.25 * inch))
     
     # Company Overview
-    company_data = analytics_service.get_company_analytics(db)
     elements.append(Paragraph("Company Overview", heading_style))
     
     company_table_data = [
@@ -65,88 +152,51 @@ def generate_pdf_report(db: Session) -> Tuple[str, str]:
         ["Total Employees", str(company_data["employee_count"])],
         ["Total Departments", str(company_data["department_count"])],
         ["Total Projects", str(company_data["project_count"])],
-        ["Total Revenue", f"${company_data['total_revenue']:,.2f}"],
-        ["Total Cost", f"${company_data['total_cost']:,.2f}"],
-        ["Profit", f"${company_data['profit']:,.2f}"],
+        ["Total Revenue", format_currency(company_data['total_revenue'])],
+        ["Total Cost", format_currency(company_data['total_cost'])],
+        ["Profit", format_currency(company_data['profit'])],
         ["Profit Margin", f"{company_data['profit_margin']:.2f}%"],
         ["ROI", f"{company_data['roi']:.2f}"],
         ["Productivity Index", f"${company_data['productivity_index']:.2f}/hour"],
     ]
     
     company_table = Table(company_table_data, colWidths=[2.5*inch, 2.5*inch])
-    company_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (1, 0), 12),
-        ('BACKGROUND', (0, 1), (1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-    ]))
+    company_table.setStyle(_COMPANY_TABLE_STYLE)
     elements.append(company_table)
     elements.append(Spacer(1, 0.25 * inch))
     
     # Department ROI Summary
     elements.append(Paragraph("Department ROI Summary", heading_style))
     
-    departments = db.query(Department).all()
-    dept_data = [["Department", "Budget", "Revenue", "Cost", "ROI", "Productivity"]]
-    
-    for dept in departments:
-        analytics = analytics_service.get_department_analytics(db, dept.id)
-        dept_data.append([
-            dept.name,
-            f"${dept.budget:,.2f}",
-            f"${analytics['total_revenue']:,.2f}",
-            f"${analytics['total_salary_cost'] + analytics['total_project_cost']:,.2f}",
-            f"{analytics['roi']:.2f}",
-            f"${analytics['productivity_index']:.2f}/hour"
-        ])
+    dept_data = _formatted_table(pd.DataFrame(list(dept_analytics.values())), [
+        ("Department", "department_name", None),
+        ("Budget", "budget", format_currency),
+        ("Revenue", "total_revenue", format_currency),
+        ("Cost", "total_cost", format_currency),
+        ("ROI", "roi", "{:.2f}".format),
+        ("Productivity", "productivity_index", "${:.2f}/hour".format),
+    ])
     
     dept_table = Table(dept_data, colWidths=[1.2*inch, 1*inch, 1*inch, 1*inch, 0.8*inch, 1*inch])
-    dept_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-    ]))
+    dept_table.setStyle(_DEPT_TABLE_STYLE)
     elements.append(dept_table)
     elements.append(Spacer(1, 0.25 * inch))
     
     # Top Performing Employees
     elements.append(Paragraph("Top Performing Employees", heading_style))
     
-    top_employees = analytics_service.get_top_performers(db, limit=10)
-    employee_data = [["Employee", "Department", "Revenue", "Salary", "ROI"]]
-    
-    for emp in top_employees:
-        employee_data.append([
-            emp["employee_name"],
-            emp["department_name"],
-            f"${emp['revenue_generated']:,.2f}",
-            f"${emp['salary']:,.2f}",
-            f"{(emp['revenue_generated'] - emp['salary']) / emp['salary']:.2f}"
-        ])
+    top_frame = pd.DataFrame(top_employees, columns=["employee_name", "department_name", "revenue_generated", "salary"])
+    top_frame["roi"] = (top_frame["revenue_generated"] - top_frame["salary"]) / top_frame["salary"]
+    employee_data = _formatted_table(top_frame, [
+        ("Employee", "employee_name", None),
+        ("Department", "department_name", None),
+        ("Revenue", "revenue_generated", format_currency),
+        ("Salary", "salary", format_currency),
+        ("ROI", "roi", "{:.2f}".format),
+    ])
     
     emp_table = Table(employee_data, colWidths=[1.5*inch, 1.5*inch, 1*inch, 1*inch, 1*inch])
-    emp_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
-    ]))
+    emp_table.setStyle(_EMP_TABLE_STYLE)
     elements.append(emp_table)
     elements.append(Spacer(1, 0.25 * inch))
     
@@ -166,16 +216,6 @@ def generate_pdf_report(db: Session) -> Tuple[str, str]:
         insights.append("Overall productivity is below target. Consider training programs or process improvements.")
     
     # Department-level insights
-    low_roi_depts = []
-    high_roi_depts = []
-    
-    for dept in departments:
-        analytics = analytics_service.get_department_analytics(db, dept.id)
-        if analytics.get('roi', 0) < 0:
-            low_roi_depts.append(dept.name)
-        if analytics.get('roi', 0) > 1.0:  # ROI > 100%
-            high_roi_depts.append(dept.name)
-    
     if low_roi_depts:
         insights.append(f"The following departments have negative ROI: {', '.join(low_roi_depts)}. Review their operations and resource allocation.")
     
@@ -189,37 +229,47 @@ def generate_pdf_report(db: Session) -> Tuple[str, str]:
     
     # Build PDF
     doc.build(elements)
-    
-    # Save PDF to file
-    with open(filepath, "wb") as f:
-        f.write(buffer.getvalue())
-    
-    return filename, filepath
+
+
+def _add_table_sheet(wb: xlsxwriter.Workbook, title: str, headers: List[str],
+                     number_formats: List[Optional[str]], rows: List[Tuple]) -> None:
+    """Stream a sheet with a styled header row and per-column number formats."""
+    ws = wb.add_worksheet(title)
+    
+    # Column formats apply to every unformatted cell written below them
+    for col, number_format in enumerate(number_formats):
+        ws.set_column(col, col, 15, wb.add_format({"num_format": number_format}) if number_format else None)
+    
+    ws.write_row(0, 0, headers, wb.add_format(_EXCEL_HEADER_FORMAT))
+    for row_num, row in enumerate(rows, start=1):
+        ws.write_row(row_num, 0, row)
 
 
 def generate_excel_report(db: Session) -> Tuple[str, str]:
     """Generate an Excel report with multiple sheets for different analytics."""
-    # Create reports directory
-    reports_dir = create_report_directory()
-    
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"productivity_report_{timestamp}.xlsx"
-    filepath = os.path.join(reports_dir, filename)
+    filename, filepath = _report_file("xlsx")
+    _build_xlsx(_fetch_report_data(db, ("excel",)), filepath)
+    return filename, filepath
+
+
+def _build_xlsx(data: Dict[str, Any], filepath: str) -> None:
+    """Write the Excel report for pre-fetched report data."""
+    company_data = data["company"]
+    dept_analytics = data["departments"]
+    emp_analytics = data["employees"]
+    proj_analytics = data["projects"]
     
-    # Create workbook
-    wb = Workbook()
+    # Create workbook; constant_memory flushes each row to disk once the next one starts
+    wb = xlsxwriter.Workbook(filepath, {"constant_memory": True})
     
     # Company Overview Sheet
-    company_sheet = wb.active
-    company_sheet.title = "Company Overview"
+    company_sheet = wb.add_worksheet("Company Overview")
     
-    company_data = analytics_service.get_company_analytics(db)
+    # Format columns
+    company_sheet.set_column(0, 1, 20)
     
     # Add title
-    company_sheet["A1"] = "Company Overview"
-    company_sheet["A1"].font = Font(size=14, bold=True)
-    company_sheet.merge_cells("A1:B1")
+    company_sheet.merge_range("A1:B1", "Company Overview", wb.add_format({"bold": True, "font_size": 14}))
     
     # Add data
     metrics = [
@@ -235,103 +285,194 @@ def generate_excel_report(db: Session) -> Tuple[str, str]:
         ["Total Hours", company_data["total_hours"]],
     ]
     
-    for i, (metric, value) in enumerate(metrics, start=3):
-        company_sheet[f"A{i}"] = metric
-        company_sheet[f"B{i}"] = value
-        if isinstance(value, float):
-            company_sheet[f"B{i}"].number_format = '#,##0.00'
-    
-    # Format columns
-    for col in ["A", "B"]:
-        company_sheet.column_dimensions[col].width = 20
+    amount_format = wb.add_format({"num_format": "#,##0.00"})
+    for row_num, (metric, value) in enumerate(metrics, start=2):
+        company_sheet.write(row_num, 0, metric)
+        company_sheet.write(row_num, 1, value, amount_format if isinstance(value, float) else None)
     
     # Department Sheet
-    dept_sheet = wb.create_sheet(title="Departments")
-    
-    # Add headers
-    headers = ["Department", "Budget", "Revenue", "Cost", "Profit", "ROI", "Productivity"]
-    for col_num, header in enumerate(headers, start=1):
-        cell = dept_sheet.cell(row=1, column=col_num, value=header)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Add department data
-    departments = db.query(Department).all()
-    for row_num, dept in enumerate(departments, start=2):
-        analytics = analytics_service.get_department_analytics(db, dept.id)
-        
-        dept_sheet.cell(row=row_num, column=1, value=dept.name)
-        dept_sheet.cell(row=row_num, column=2, value=dept.budget).number_format = '#,##0.00'
-        dept_sheet.cell(row=row_num, column=3, value=analytics["total_revenue"]).number_format = '#,##0.00'
-        dept_sheet.cell(row=row_num, column=4, value=analytics["total_salary_cost"] + analytics["total_project_cost"]).number_format = '#,##0.00'
-        dept_sheet.cell(row=row_num, column=5, value=analytics["profit"]).number_format = '#,##0.00'
-        dept_sheet.cell(row=row_num, column=6, value=analytics["roi"]).number_format = '0.00'
-        dept_sheet.cell(row=row_num, column=7, value=analytics["productivity_index"]).number_format = '0.00'
-    
-    # Format columns
-    for col in range(1, len(headers) + 1):
-        dept_sheet.column_dimensions[get_column_letter(col)].width = 15
+    _add_table_sheet(
+        wb, "Departments",
+        ["Department", "Budget", "Revenue", "Cost", "Profit", "ROI", "Productivity"],
+        [None, '#,##0.00', '#,##0.00', '#,##0.00', '#,##0.00', '0.00', '0.00'],
+        [
+            (
+                analytics["department_name"],
+                analytics["budget"],
+                analytics["total_revenue"],
+                analytics["total_cost"],
+                analytics["profit"],
+                analytics["roi"],
+                analytics["productivity_index"],
+            )
+            for analytics in dept_analytics.values()
+        ],
+    )
     
     # Employees Sheet
-    emp_sheet = wb.create_sheet(title="Employees")
-    
-    # Add headers
-    headers = ["Employee", "Department", "Salary", "Revenue", "ROI", "Productivity", "Utilization"]
-    for col_num, header in enumerate(headers, start=1):
-        cell = emp_sheet.cell(row=1, column=col_num, value=header)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Add employee data
-    employees = db.query(Employee).all()
-    for row_num, emp in enumerate(employees, start=2):
-        analytics = analytics_service.get_employee_analytics(db, emp.id)
-        department = db.query(Department).filter(Department.id == emp.department_id).first()
-        
-        emp_sheet.cell(row=row_num, column=1, value=emp.name)
-        emp_sheet.cell(row=row_num, column=2, value=department.name if department else "")
-        emp_sheet.cell(row=row_num, column=3, value=emp.salary).number_format = '#,##0.00'
-        emp_sheet.cell(row=row_num, column=4, value=emp.revenue_generated).number_format = '#,##0.00'
-        emp_sheet.cell(row=row_num, column=5, value=analytics["roi"]).number_format = '0.00'
-        emp_sheet.cell(row=row_num, column=6, value=analytics["productivity_index"]).number_format = '0.00'
-        emp_sheet.cell(row=row_num, column=7, value=analytics["utilization_rate"]).number_format = '0.00%'
-    
-    # Format columns
-    for col in range(1, len(headers) + 1):
-        emp_sheet.column_dimensions[get_column_letter(col)].width = 15
+    _add_table_sheet(
+        wb, "Employees",
+        ["Employee", "Department", "Salary", "Revenue", "ROI", "Productivity", "Utilization"],
+        [None, None, '#,##0.00', '#,##0.00', '0.00', '0.00', '0.00%'],
+        [
+            (
+                analytics["employee_name"],
+                analytics["department_name"],
+                analytics["salary"],
+                analytics["revenue_generated"],
+                analytics["roi"],
+                analytics["productivity_index"],
+                analytics["utilization_rate"],
+            )
+            for analytics in emp_analytics.values()
+        ],
+    )
     
     # Projects Sheet
-    proj_sheet = wb.create_sheet(title="Projects")
-    
-    # Add headers
-    headers = ["Project", "Department", "Cost", "Revenue", "Profit", "Margin", "Hours"]
-    for col_num, header in enumerate(headers, start=1):
-        cell = proj_sheet.cell(row=1, column=col_num, value=header)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    
-    # Add project data
-    projects = db.query(Project).all()
-    for row_num, proj in enumerate(projects, start=2):
-        analytics = analytics_service.get_project_analytics(db, proj.id)
-        department = db.query(Department).filter(Department.id == proj.department_id).first()
-        
-        proj_sheet.cell(row=row_num, column=1, value=proj.name)
-        proj_sheet.cell(row=row_num, column=2, value=department.name if department else "")
-        proj_sheet.cell(row=row_num, column=3, value=analytics["total_cost"]).number_format = '#,##0.00'
-        proj_sheet.cell(row=row_num, column=4, value=proj.revenue).number_format = '#,##0.00'
-        proj_sheet.cell(row=row_num, column=5, value=analytics["profit"]).number_format = '#,##0.00'
-        proj_sheet.cell(row=row_num, column=6, value=analytics["profit_margin"] / 100).number_format = '0.00%'
-        proj_sheet.cell(row=row_num, column=7, value=analytics["total_hours"]).number_format = '#,##0.00'
-    
-    # Format columns
-    for col in range(1, len(headers) + 1):
-        proj_sheet.column_dimensions[get_column_letter(col)].width = 15
+    _add_table_sheet(
+        wb, "Projects",
+        ["Project", "Department", "Cost", "Revenue", "Profit", "Margin", "Hours"],
+        [None, None, '#,##0.00', '#,##0.00', '#,##0.00', '0.00%', '#,##0.00'],
+        [
+            (
+                analytics["project_name"],
+                analytics["department_name"],
+                analytics["total_cost"],
+                analytics["revenue"],
+                analytics["profit"],
+                analytics["profit_margin"] / 100,
+                analytics["total_hours"],
+            )
+            for analytics in proj_analytics.values()
+        ],
+    )
     
     # Save workbook
-    wb.save(filepath)
-    
-    return filename, filepath
+    wb.close()
+
+
+def generate_reports(db: Session, formats: Tuple[str, ...] = ("pdf", "excel")) -> Dict[str, Tuple[str, str]]:
+    """
+    Generate several report formats from one fetch of the analytics data,
+    building the files concurrently. Returns {format: (filename, filepath)}.
+    """
+    builders = {"pdf": ("pdf", _build_pdf), "excel": ("xlsx", _build_xlsx)}
+    unknown = [report_format for report_format in formats if report_format not in builders]
+    if unknown:
+        raise ValueError(f"Invalid report type: {', '.join(unknown)}. Use 'pdf' or 'excel'.")
+    
+    data = _fetch_report_data(db, formats)
+    files = {report_format: _report_file(builders[report_format][0]) for report_format in formats}
+    
+    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+        futures = [
+            executor.submit(builders[report_format][1], data, files[report_format][1])
+            for report_format in formats
+        ]
+        for future in futures:
+            future.result()
+    
+    return files
+
+
+# Report types a background job can produce, and the formats each one builds
+REPORT_JOB_FORMATS = {
+    "pdf": ("pdf",),
+    "excel": ("excel",),
+    "both": ("pdf", "excel"),
+}
+
+# Seconds a background report job (status file and report) is kept after its last update
+REPORT_JOB_TTL_SECONDS = 60 * 60
+
+
+def _report_jobs_directory() -> str:
+    """Directory of job status files, shared by every worker process."""
+    jobs_dir = os.path.join(create_report_directory(), "jobs")
+    os.makedirs(jobs_dir, exist_ok=True)
+    return jobs_dir
+
+
+def _report_job_path(task_id: str) -> Optional[str]:
+    """Status file path for a task id, or None if it isn't one we could have issued."""
+    if len(task_id) != 32 or not all(char in string.hexdigits for char in task_id):
+        return None
+    return os.path.join(_report_jobs_directory(), f"{task_id}.json")
+
+
+def _write_report_job(job: Dict[str, Any]) -> None:
+    """Write a job's status file; the rename keeps readers from seeing a partial file."""
+    path = _report_job_path(job["task_id"])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(job, f)
+    os.replace(tmp_path, path)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        # Another worker removed it first
+        pass
+
+
+def _expire_report_jobs() -> None:
+    """Delete jobs, and the reports they produced, not updated within the TTL."""
+    cutoff = time.time() - REPORT_JOB_TTL_SECONDS
+    for entry in os.scandir(_report_jobs_directory()):
+        try:
+            if not entry.name.endswith(".json") or entry.stat().st_mtime >= cutoff:
+                continue
+            with open(entry.path) as f:
+                files = json.load(f).get("files", {})
+        except (FileNotFoundError, ValueError):
+            # Another worker expired it first, or the file is unreadable
+            continue
+        for report in files.values():
+            _remove_file(report["filepath"])
+        _remove_file(entry.path)
+
+
+def create_report_job(report_type: str) -> str:
+    """Register a pending report job and return its task id."""
+    _expire_report_jobs()
+    task_id = uuid.uuid4().hex
+    _write_report_job({"task_id": task_id, "report_type": report_type, "status": "pending"})
+    return task_id
+
+
+def run_report_job(task_id: str) -> None:
+    """Generate the reports for a registered job with its own session, recording the outcome."""
+    job = get_report_job(task_id)
+    if job is None:
+        return
+    
+    db = SessionLocal()
+    try:
+        files = generate_reports(db, REPORT_JOB_FORMATS[job["report_type"]])
+        job.update({
+            "status": "completed",
+            "files": {
+                report_format: {"filename": filename, "filepath": filepath}
+                for report_format, (filename, filepath) in files.items()
+            },
+        })
+    except Exception as e:
+        job.update({"status": "failed", "error": str(e)})
+    finally:
+        db.close()
+    
+    _write_report_job(job)
+
+
+def get_report_job(task_id: str) -> Optional[Dict[str, Any]]:
+    """Return a report job's status, or None if the task id is unknown or expired."""
+    path = _report_job_path(task_id)
+    if path is None:
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
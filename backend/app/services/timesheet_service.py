@@ -7,7 +7,7 @@ from app.models.timesheet import Timesheet
 
 
 def get(db: Session, timesheet_id: int) -> Optional[Timesheet]:
-    return db.query(Timesheet).filter(Timesheet.id == timesheet_id).first()
+    return db.get(Timesheet, timesheet_id)
 
 
 def get_multi(
@@ -63,7 +63,7 @@ def update(
 
 
 def remove(db: Session, *, timesheet_id: int) -> Timesheet:
-    obj = db.query(Timesheet).get(timesheet_id)
+    obj = db.get(Timesheet, timesheet_id)
     db.delete(obj)
     db.commit()
     return obj
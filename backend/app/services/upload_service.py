@@ -1,20 +1,75 @@
 import io
 import logging
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Any, Optional
+from sqlalchemy import insert, literal, select, union_all
 from sqlalchemy.orm import Session
 
 from app.models.employee import Employee
+from app.models.employee_hours import apply_hours_deltas
 from app.models.project import Project
 from app.models.timesheet import Timesheet
 from app.models.department import Department
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT, to keep statement size bounded on large uploads
+IMPORT_CHUNK_SIZE = 1000
+
+# Uploads at least this large are parsed with pyarrow's multithreaded CSV reader
+PYARROW_MIN_UPLOAD_BYTES = 1 << 20
+
+# Declared CSV column types, so pandas parses once without inferring them
+_CSV_DTYPES = {
+    "department_id": "Int64",
+    "employee_id": "Int64",
+    "project_id": "Int64",
+    "salary": "float64",
+    "revenue_generated": "float64",
+    "cost": "float64",
+    "revenue": "float64",
+    "hours_worked": "float64",
+}
+
 class UploadError(Exception):
     """Exception raised for errors in the upload process."""
     pass
 
+def _read_csv(file_content: bytes, columns: List[str]) -> pd.DataFrame:
+    """Parse only the given columns of an uploaded CSV, with declared dtypes."""
+    # Only columns present in the header can be selected (pyarrow rejects callables)
+    header = pd.read_csv(io.BytesIO(file_content), nrows=0).columns
+    present = [column for column in header if column in columns]
+    if not present:
+        # None of the wanted columns; keep one so every row still reaches validation and is counted as failed
+        return pd.read_csv(io.BytesIO(file_content), usecols=[0])
+    try:
+        return pd.read_csv(
+            io.BytesIO(file_content),
+            engine="pyarrow" if len(file_content) >= PYARROW_MIN_UPLOAD_BYTES else "c",
+            usecols=present,
+            dtype={column: _CSV_DTYPES[column] for column in present if column in _CSV_DTYPES},
+            parse_dates=["date"] if "date" in present else None,
+        )
+    except (ValueError, TypeError):
+        # A value doesn't fit its declared type; parse untyped so validation can report it
+        return pd.read_csv(io.BytesIO(file_content), usecols=present)
+
+def _insert_records(db: Session, model, records: List[Dict[str, Any]]) -> None:
+    """Insert records with Core executemany, one statement per chunk."""
+    stmt = insert(model.__table__)
+    for start in range(0, len(records), IMPORT_CHUNK_SIZE):
+        db.execute(stmt, records[start:start + IMPORT_CHUNK_SIZE])
+
+def _numeric_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return a column as floats, with NaN wherever a value isn't numeric."""
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+def _has_empty_names(df: pd.DataFrame) -> bool:
+    names = df["name"].to_numpy()
+    return bool(np.logical_or(pd.isna(names), names == "").any())
+
 def validate_employee_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
     """Validate employee data from CSV."""
     errors = []
@@ -27,18 +82,19 @@ def validate_employee_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
         return False, errors
     
     # Check data types
-    if not pd.api.types.is_numeric_dtype(df["department_id"]):
+    if np.isnan(_numeric_values(df, "department_id")).any():
         errors.append("department_id must be numeric")
     
-    if not pd.api.types.is_numeric_dtype(df["salary"]):
+    salary = _numeric_values(df, "salary")
+    if np.isnan(salary).any():
         errors.append("salary must be numeric")
     
     # Check for negative salary
-    if (df["salary"] <= 0).any():
+    if (salary <= 0).any():
         errors.append("salary must be positive")
     
     # Check for empty names
-    if df["name"].isna().any() or (df["name"] == "").any():
+    if _has_empty_names(df):
         errors.append("name cannot be empty")
     
     return len(errors) == 0, errors
@@ -55,24 +111,26 @@ def validate_project_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
         return False, errors
     
     # Check data types
-    if not pd.api.types.is_numeric_dtype(df["department_id"]):
+    if np.isnan(_numeric_values(df, "department_id")).any():
         errors.append("department_id must be numeric")
     
-    if not pd.api.types.is_numeric_dtype(df["cost"]):
+    cost = _numeric_values(df, "cost")
+    if np.isnan(cost).any():
         errors.append("cost must be numeric")
     
-    if not pd.api.types.is_numeric_dtype(df["revenue"]):
+    revenue = _numeric_values(df, "revenue")
+    if np.isnan(revenue).any():
         errors.append("revenue must be numeric")
     
     # Check for negative values
-    if (df["cost"] < 0).any():
+    if (cost < 0).any():
         errors.append("cost cannot be negative")
     
-    if (df["revenue"] < 0).any():
+    if (revenue < 0).any():
         errors.append("revenue cannot be negative")
     
     # Check for empty names
-    if df["name"].isna().any() or (df["name"] == "").any():
+    if _has_empty_names(df):
         errors.append("name cannot be empty")
     
     return len(errors) == 0, errors
@@ -89,13 +147,14 @@ def validate_timesheet_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
         return False, errors
     
     # Check data types
-    if not pd.api.types.is_numeric_dtype(df["employee_id"]):
+    if np.isnan(_numeric_values(df, "employee_id")).any():
         errors.append("employee_id must be numeric")
     
-    if not pd.api.types.is_numeric_dtype(df["project_id"]):
+    if np.isnan(_numeric_values(df, "project_id")).any():
         errors.append("project_id must be numeric")
     
-    if not pd.api.types.is_numeric_dtype(df["hours_worked"]):
+    hours_worked = _numeric_values(df, "hours_worked")
+    if np.isnan(hours_worked).any():
         errors.append("hours_worked must be numeric")
     
     # Check for valid date format
@@ -105,7 +164,7 @@ def validate_timesheet_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
         errors.append("date must be in a valid date format (YYYY-MM-DD)")
     
     # Check for negative or zero hours
-    if (df["hours_worked"] <= 0).any():
+    if (hours_worked <= 0).any():
         errors.append("hours_worked must be positive")
     
     return len(errors) == 0, errors
@@ -114,7 +173,7 @@ def import_employees(db: Session, file_content: bytes) -> Dict[str, Any]:
     """Import employees from CSV file."""
     try:
         # Read CSV
-        df = pd.read_csv(io.BytesIO(file_content))
+        df = _read_csv(file_content, ["name", "department_id", "salary", "revenue_generated"])
         
         # Validate data
         is_valid, errors = validate_employee_data(df)
@@ -127,7 +186,7 @@ def import_employees(db: Session, file_content: bytes) -> Dict[str, Any]:
             }
         
         # Check if departments exist
-        department_ids = df["department_id"].unique()
+        department_ids = df["department_id"].unique().tolist()
         existing_departments = db.query(Department.id).filter(Department.id.in_(department_ids)).all()
         existing_department_ids = [d[0] for d in existing_departments]
         
@@ -140,31 +199,18 @@ def import_employees(db: Session, file_content: bytes) -> Dict[str, Any]:
                 "failed": len(df)
             }
         
-        # Import data
-        imported = 0
-        failed = 0
-        
-        for _, row in df.iterrows():
-            try:
-                employee = Employee(
-                    name=row["name"],
-                    department_id=row["department_id"],
-                    salary=row["salary"],
-                    revenue_generated=row.get("revenue_generated", 0.0)
-                )
-                db.add(employee)
-                imported += 1
-            except Exception as e:
-                logger.error(f"Error importing employee: {str(e)}")
-                failed += 1
-        
+        # Import data with chunked bulk inserts; validation already rejected bad rows
+        records = df[["name", "department_id", "salary"]].assign(
+            revenue_generated=df.get("revenue_generated", 0.0)
+        ).to_dict(orient="records")
+        _insert_records(db, Employee, records)
         db.commit()
         
         return {
             "success": True,
             "errors": [],
-            "imported": imported,
-            "failed": failed
+            "imported": len(records),
+            "failed": 0
         }
     
     except Exception as e:
@@ -181,7 +227,7 @@ def import_projects(db: Session, file_content: bytes) -> Dict[str, Any]:
     """Import projects from CSV file."""
     try:
         # Read CSV
-        df = pd.read_csv(io.BytesIO(file_content))
+        df = _read_csv(file_content, ["name", "department_id", "cost", "revenue"])
         
         # Validate data
         is_valid, errors = validate_project_data(df)
@@ -194,7 +240,7 @@ def import_projects(db: Session, file_content: bytes) -> Dict[str, Any]:
             }
         
         # Check if departments exist
-        department_ids = df["department_id"].unique()
+        department_ids = df["department_id"].unique().tolist()
         existing_departments = db.query(Department.id).filter(Department.id.in_(department_ids)).all()
         existing_department_ids = [d[0] for d in existing_departments]
         
@@ -207,31 +253,16 @@ def import_projects(db: Session, file_content: bytes) -> Dict[str, Any]:
                 "failed": len(df)
             }
         
-        # Import data
-        imported = 0
-        failed = 0
-        
-        for _, row in df.iterrows():
-            try:
-                project = Project(
-                    name=row["name"],
-                    department_id=row["department_id"],
-                    cost=row["cost"],
-                    revenue=row["revenue"]
-                )
-                db.add(project)
-                imported += 1
-            except Exception as e:
-                logger.error(f"Error importing project: {str(e)}")
-                failed += 1
-        
+        # Import data with chunked bulk inserts; validation already rejected bad rows
+        records = df[["name", "department_id", "cost", "revenue"]].to_dict(orient="records")
+        _insert_records(db, Project, records)
         db.commit()
         
         return {
             "success": True,
             "errors": [],
-            "imported": imported,
-            "failed": failed
+            "imported": len(records),
+            "failed": 0
         }
     
     except Exception as e:
@@ -248,7 +279,7 @@ def import_timesheets(db: Session, file_content: bytes) -> Dict[str, Any]:
     """Import timesheets from CSV file."""
     try:
         # Read CSV
-        df = pd.read_csv(io.BytesIO(file_content))
+        df = _read_csv(file_content, ["employee_id", "project_id", "hours_worked", "date"])
         
         # Validate data
         is_valid, errors = validate_timesheet_data(df)
@@ -263,10 +294,15 @@ def import_timesheets(db: Session, file_content: bytes) -> Dict[str, Any]:
         # Convert date column to datetime
         df["date"] = pd.to_datetime(df["date"]).dt.date
         
-        # Check if employees exist
-        employee_ids = df["employee_id"].unique()
-        existing_employees = db.query(Employee.id).filter(Employee.id.in_(employee_ids)).all()
-        existing_employee_ids = [e[0] for e in existing_employees]
+        # Check that the referenced employees and projects exist in one round-trip
+        employee_ids = df["employee_id"].unique().tolist()
+        project_ids = df["project_id"].unique().tolist()
+        existing = db.execute(union_all(
+            select(literal("employee"), Employee.id).where(Employee.id.in_(employee_ids)),
+            select(literal("project"), Project.id).where(Project.id.in_(project_ids)),
+        )).all()
+        existing_employee_ids = {id for kind, id in existing if kind == "employee"}
+        existing_project_ids = {id for kind, id in existing if kind == "project"}
         
         missing_employees = [id for id in employee_ids if id not in existing_employee_ids]
         if missing_employees:
@@ -277,11 +313,6 @@ def import_timesheets(db: Session, file_content: bytes) -> Dict[str, Any]:
                 "failed": len(df)
             }
         
-        # Check if projects exist
-        project_ids = df["project_id"].unique()
-        existing_projects = db.query(Project.id).filter(Project.id.in_(project_ids)).all()
-        existing_project_ids = [p[0] for p in existing_projects]
-        
         missing_projects = [id for id in project_ids if id not in existing_project_ids]
         if missing_projects:
             return {
@@ -291,31 +322,21 @@ def import_timesheets(db: Session, file_content: bytes) -> Dict[str, Any]:
                 "failed": len(df)
             }
         
-        # Import data
-        imported = 0
-        failed = 0
-        
-        for _, row in df.iterrows():
-            try:
-                timesheet = Timesheet(
-                    employee_id=row["employee_id"],
-                    project_id=row["project_id"],
-                    hours_worked=row["hours_worked"],
-                    date=row["date"]
-                )
-                db.add(timesheet)
-                imported += 1
-            except Exception as e:
-                logger.error(f"Error importing timesheet: {str(e)}")
-                failed += 1
+        # Import data with chunked bulk inserts; validation already rejected bad rows
+        records = df[["employee_id", "project_id", "hours_worked", "date"]].to_dict(orient="records")
+        _insert_records(db, Timesheet, records)
         
+        # Core inserts skip ORM events, so update the monthly hours rollup here
+        apply_hours_deltas(db.connection(), [
+            (record["employee_id"], record["date"], record["hours_worked"]) for record in records
+        ])
         db.commit()
         
         return {
             "success": True,
             "errors": [],
-            "imported": imported,
-            "failed": failed
+            "imported": len(records),
+            "failed": 0
         }
     
     except Exception as e:
@@ -8,7 +8,7 @@ from app.api.v1.schemas.user import UserCreate, UserUpdate
 
 
 def get(db: Session, id: int) -> Optional[User]:
-    return db.query(User).filter(User.id == id).first()
+    return db.get(User, id)
 
 
 def get_by_email(db: Session, email: str) -> Optional[User]:
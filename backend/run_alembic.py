@@ -1,13 +1,53 @@
+import hashlib
 import os
 import sys
 from alembic.config import Config
 from alembic import command
 
+from app.db.base import Base
+
 # Get the directory of this script
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
+# Hash of the model schema the last revision was generated from
+hash_path = os.path.join(dir_path, ".alembic_schema_hash")
+
+
+def schema_hash() -> str:
+    """Hash the tables, columns and indexes declared on the models."""
+    parts = []
+    for table in sorted(Base.metadata.tables.values(), key=lambda t: t.name):
+        parts.append(f"table {table.name}")
+        for column in table.columns:
+            parts.append(
+                f"column {column.name} {column.type} nullable={column.nullable} "
+                f"pk={column.primary_key} computed={column.computed.sqltext if column.computed is not None else None} "
+                f"fks={sorted(fk.target_fullname for fk in column.foreign_keys)}"
+            )
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            parts.append(f"index {index.name} {[str(expr) for expr in index.expressions]} unique={index.unique}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+# Usage: python run_alembic.py ["migration message"]
+message = sys.argv[1] if len(sys.argv) > 1 else "Initial migration"
+
+# Skip the autogenerate (a full reflection and diff of the database) when the models haven't changed
+current_hash = schema_hash()
+previous_hash = None
+if os.path.exists(hash_path):
+    with open(hash_path) as f:
+        previous_hash = f.read().strip()
+
+if current_hash == previous_hash:
+    print("No schema change since the last revision; skipping autogenerate.")
+    sys.exit(0)
+
 # Create the Alembic configuration
 alembic_cfg = Config(os.path.join(dir_path, "alembic.ini"))
 
 # Run the autogenerate command
-command.revision(alembic_cfg, "Initial migration", autogenerate=True)
+command.revision(alembic_cfg, message, autogenerate=True)
+
+with open(hash_path, "w") as f:
+    f.write(current_hash)
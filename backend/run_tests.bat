@@ -1,3 +1,3 @@
 @echo off
 echo Running tests with pytest...
-pytest -v tests/
+pytest -v -n auto --dist=loadfile -m "not slow" tests/
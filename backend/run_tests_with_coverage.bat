@@ -1,4 +1,4 @@
 @echo off
 echo Running tests with coverage...
-pytest --cov=app --cov-report=html --cov-report=term-missing -v tests/
+pytest -n auto --dist=loadfile -m "not slow" --cov=app --cov-report=html --cov-report=term-missing -v tests/
 echo Coverage report generated in htmlcov/ directory
@@ -1,169 +1,246 @@
-import os
-import sys
-from datetime import date
+import argparse
+from collections import defaultdict
+from datetime import date, timedelta
+from itertools import islice
+from typing import Iterable, Iterator, List
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 
-# Add the parent directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from app.db.base import Base
 from app.models.department import Department
 from app.models.employee import Employee
+from app.models.employee_hours import apply_hours_deltas
 from app.models.project import Project
 from app.models.timesheet import Timesheet
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
 from app.core.config import settings
 
-# Create database engine
-engine = create_engine(settings.DATABASE_URL)
+# On psycopg2, also batch executemany for statements other than INSERT
+# (INSERTs are already paged by insertmanyvalues below)
+PSYCOPG2_ENGINE_OPTIONS = {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+dialect_options = (
+    PSYCOPG2_ENGINE_OPTIONS if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2" else {}
+)
+
+# Create database engine; multi-row inserts are batched into INSERT..VALUES pages
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=True,  # Check connection validity before using it
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    insertmanyvalues_page_size=1000,
+    **dialect_options,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def seed_db():
-    """Seed the database with initial data."""
-    db = SessionLocal()
-    
+# Sample rows, inserted with Core executemany; the employee, project and
+# timesheet rows refer to departments, employees and projects by their ids
+DEPARTMENT_ROWS = [
+    {"name": "Engineering", "budget": 500000.0},
+    {"name": "Marketing", "budget": 300000.0},
+    {"name": "Sales", "budget": 400000.0},
+    {"name": "Human Resources", "budget": 200000.0},
+    {"name": "Finance", "budget": 250000.0},
+]
+
+EMPLOYEE_ROWS = [
+    # Engineering
+    {"name": "John Smith", "department_id": 1, "salary": 120000.0, "revenue_generated": 250000.0},
+    {"name": "Jane Doe", "department_id": 1, "salary": 110000.0, "revenue_generated": 220000.0},
+    {"name": "Mike Johnson", "department_id": 1, "salary": 95000.0, "revenue_generated": 180000.0},
+
+    # Marketing
+    {"name": "Sarah Williams", "department_id": 2, "salary": 90000.0, "revenue_generated": 200000.0},
+    {"name": "David Brown", "department_id": 2, "salary": 85000.0, "revenue_generated": 170000.0},
+
+    # Sales
+    {"name": "Emily Davis", "department_id": 3, "salary": 100000.0, "revenue_generated": 300000.0},
+    {"name": "Robert Wilson", "department_id": 3, "salary": 95000.0, "revenue_generated": 280000.0},
+    {"name": "Jennifer Taylor", "department_id": 3, "salary": 90000.0, "revenue_generated": 260000.0},
+
+    # HR
+    {"name": "Michael Anderson", "department_id": 4, "salary": 85000.0, "revenue_generated": 100000.0},
+    {"name": "Lisa Thomas", "department_id": 4, "salary": 80000.0, "revenue_generated": 90000.0},
+
+    # Finance
+    {"name": "James Martinez", "department_id": 5, "salary": 110000.0, "revenue_generated": 150000.0},
+    {"name": "Patricia Robinson", "department_id": 5, "salary": 100000.0, "revenue_generated": 130000.0},
+]
+
+PROJECT_ROWS = [
+    # Engineering
+    {"name": "Product Redesign", "department_id": 1, "cost": 50000.0, "revenue": 150000.0},
+    {"name": "Mobile App Development", "department_id": 1, "cost": 80000.0, "revenue": 200000.0},
+
+    # Marketing
+    {"name": "Brand Campaign", "department_id": 2, "cost": 40000.0, "revenue": 120000.0},
+    {"name": "Social Media Strategy", "department_id": 2, "cost": 25000.0, "revenue": 80000.0},
+
+    # Sales
+    {"name": "Enterprise Client Acquisition", "department_id": 3, "cost": 30000.0, "revenue": 200000.0},
+    {"name": "Sales Team Training", "department_id": 3, "cost": 15000.0, "revenue": 50000.0},
+
+    # HR
+    {"name": "Employee Wellness Program", "department_id": 4, "cost": 20000.0, "revenue": 40000.0},
+
+    # Finance
+    {"name": "Cost Optimization", "department_id": 5, "cost": 10000.0, "revenue": 100000.0},
+]
+
+# Rows per insert statement when generating load data, so large seeds aren't held in memory
+SEED_CHUNK_SIZE = 1000
+
+# Sample timesheet weeks, and for each employee the (project_id, hours_worked)
+# logged in each of those weeks
+TIMESHEET_WEEKS = (date(2023, 10, 1), date(2023, 10, 8))
+TIMESHEET_SPECS = [
+    # Engineering employees on engineering projects
+    (1, ((1, 40.0), (2, 40.0))),
+    (2, ((1, 35.0), (2, 45.0))),
+    (3, ((1, 38.0), (2, 42.0))),
+
+    # Marketing employees on marketing projects
+    (4, ((3, 40.0), (4, 40.0))),
+    (5, ((3, 38.0), (4, 42.0))),
+
+    # Sales employees on sales projects
+    (6, ((5, 45.0), (6, 40.0))),
+    (7, ((5, 40.0), (6, 40.0))),
+    (8, ((5, 38.0), (6, 42.0))),
+
+    # HR employees on HR projects
+    (9, ((7, 40.0), (7, 40.0))),
+    (10, ((7, 38.0), (7, 42.0))),
+
+    # Finance employees on finance projects
+    (11, ((8, 40.0), (8, 40.0))),
+    (12, ((8, 38.0), (8, 42.0))),
+]
+
+def _is_empty(db, model) -> bool:
+    """Whether a table has no rows; stops at the first row instead of counting them all."""
+    return db.query(model.id).first() is None
+
+def _chunks(rows: Iterable[dict], size: int = SEED_CHUNK_SIZE) -> Iterator[List[dict]]:
+    """Yield lists of at most size rows, without materializing the whole iterable."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+def _seed_load_data(db, employee_count: int, timesheets_per_employee: int):
+    """Add generated employees, and weekly timesheets for them, for load testing."""
+    projects_by_department = defaultdict(list)
+    for project_id, department_id in db.query(Project.id, Project.department_id).order_by(Project.id):
+        projects_by_department[department_id].append(project_id)
+    department_ids = sorted(projects_by_department)
+    if not department_ids:
+        print("No projects to log generated timesheets against; skipping load data")
+        return
+
+    employee_rows = (
+        {
+            "name": f"Employee {i}",
+            "department_id": department_ids[i % len(department_ids)],
+            "salary": 60000.0 + 1000.0 * (i % 60),
+            "revenue_generated": 80000.0 + 2500.0 * (i % 80),
+        }
+        for i in range(1, employee_count + 1)
+    )
+    employee_table = Employee.__table__
+    employee_stmt = insert(employee_table).returning(
+        employee_table.c.id, employee_table.c.department_id, sort_by_parameter_order=True
+    )
+    employees = []
+    for chunk in _chunks(employee_rows):
+        employees.extend(db.execute(employee_stmt, chunk).all())
+
+    def timesheet_rows():
+        for employee_id, department_id in employees:
+            projects = projects_by_department[department_id]
+            for week in range(timesheets_per_employee):
+                yield {
+                    "employee_id": employee_id,
+                    "project_id": projects[week % len(projects)],
+                    "hours_worked": 35.0 + (employee_id + week) % 11,
+                    "date": TIMESHEET_WEEKS[0] + timedelta(weeks=week),
+                }
+
+    timesheet_count = 0
+    for chunk in _chunks(timesheet_rows()):
+        db.execute(insert(Timesheet.__table__), chunk)
+        # Core inserts skip ORM events, so update the monthly hours rollup here
+        apply_hours_deltas(db.connection(), [
+            (row["employee_id"], row["date"], row["hours_worked"]) for row in chunk
+        ])
+        timesheet_count += len(chunk)
+    print(f"Created {len(employees)} generated employees with {timesheet_count} timesheets")
+
+def seed_db(employee_count: int = 0, timesheets_per_employee: int = 0):
+    """Seed the database with initial data, plus optional generated load data."""
+    # Everything is written in one transaction: committed once at the end of the
+    # block, rolled back as a whole if any step fails
     try:
-        # Create admin user if it doesn't exist
-        user = db.query(User).filter(User.email == settings.FIRST_SUPERUSER).first()
-        if not user:
-            user = User(
-                email=settings.FIRST_SUPERUSER,
-                hashed_password=get_password_hash(settings.FIRST_SUPERUSER_PASSWORD),
-                full_name="Administrator",
-                role=UserRole.ADMIN,
-                is_active=True,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            print("Admin user created")
+        with SessionLocal() as db, db.begin():
+            # Create admin user if it doesn't exist; only its id is fetched, and the
+            # (slow) password hash is computed only when the user is missing
+            admin_exists = db.query(User.id).filter(User.email == settings.FIRST_SUPERUSER).scalar() is not None
+            if not admin_exists:
+                user = User(
+                    email=settings.FIRST_SUPERUSER,
+                    hashed_password=get_password_hash(settings.FIRST_SUPERUSER_PASSWORD),
+                    full_name="Administrator",
+                    role=UserRole.ADMIN,
+                    is_active=True,
+                )
+                db.add(user)
+                db.flush()
+                print("Admin user created")
         
-        # Create sample departments if they don't exist
-        if db.query(Department).count() == 0:
-            departments = [
-                Department(name="Engineering", budget=500000.0),
-                Department(name="Marketing", budget=300000.0),
-                Department(name="Sales", budget=400000.0),
-                Department(name="Human Resources", budget=200000.0),
-                Department(name="Finance", budget=250000.0),
-            ]
-            db.add_all(departments)
-            db.commit()
-            for dept in departments:
-                db.refresh(dept)
-            print("Sample departments created")
-        else:
-            departments = db.query(Department).all()
+            # Create sample departments if they don't exist
+            if _is_empty(db, Department):
+                db.execute(insert(Department.__table__), DEPARTMENT_ROWS)
+                print("Sample departments created")
         
-        # Create sample employees if they don't exist
-        if db.query(Employee).count() == 0:
-            employees = [
-                # Engineering
-                Employee(name="John Smith", department_id=1, salary=120000.0, revenue_generated=250000.0),
-                Employee(name="Jane Doe", department_id=1, salary=110000.0, revenue_generated=220000.0),
-                Employee(name="Mike Johnson", department_id=1, salary=95000.0, revenue_generated=180000.0),
-                
-                # Marketing
-                Employee(name="Sarah Williams", department_id=2, salary=90000.0, revenue_generated=200000.0),
-                Employee(name="David Brown", department_id=2, salary=85000.0, revenue_generated=170000.0),
-                
-                # Sales
-                Employee(name="Emily Davis", department_id=3, salary=100000.0, revenue_generated=300000.0),
-                Employee(name="Robert Wilson", department_id=3, salary=95000.0, revenue_generated=280000.0),
-                Employee(name="Jennifer Taylor", department_id=3, salary=90000.0, revenue_generated=260000.0),
-                
-                # HR
-                Employee(name="Michael Anderson", department_id=4, salary=85000.0, revenue_generated=100000.0),
-                Employee(name="Lisa Thomas", department_id=4, salary=80000.0, revenue_generated=90000.0),
-                
-                # Finance
-                Employee(name="James Martinez", department_id=5, salary=110000.0, revenue_generated=150000.0),
-                Employee(name="Patricia Robinson", department_id=5, salary=100000.0, revenue_generated=130000.0),
-            ]
-            db.add_all(employees)
-            db.commit()
-            for emp in employees:
-                db.refresh(emp)
-            print("Sample employees created")
+            # Create sample employees if they don't exist
+            if _is_empty(db, Employee):
+                db.execute(insert(Employee.__table__), EMPLOYEE_ROWS)
+                print("Sample employees created")
         
-        # Create sample projects if they don't exist
-        if db.query(Project).count() == 0:
-            projects = [
-                # Engineering
-                Project(name="Product Redesign", department_id=1, cost=50000.0, revenue=150000.0),
-                Project(name="Mobile App Development", department_id=1, cost=80000.0, revenue=200000.0),
-                
-                # Marketing
-                Project(name="Brand Campaign", department_id=2, cost=40000.0, revenue=120000.0),
-                Project(name="Social Media Strategy", department_id=2, cost=25000.0, revenue=80000.0),
-                
-                # Sales
-                Project(name="Enterprise Client Acquisition", department_id=3, cost=30000.0, revenue=200000.0),
-                Project(name="Sales Team Training", department_id=3, cost=15000.0, revenue=50000.0),
-                
-                # HR
-                Project(name="Employee Wellness Program", department_id=4, cost=20000.0, revenue=40000.0),
-                
-                # Finance
-                Project(name="Cost Optimization", department_id=5, cost=10000.0, revenue=100000.0),
-            ]
-            db.add_all(projects)
-            db.commit()
-            for proj in projects:
-                db.refresh(proj)
-            print("Sample projects created")
-        
-        # Create sample timesheets if they don't exist
-        if db.query(Timesheet).count() == 0:
-            timesheets = [
-                # Engineering employees on engineering projects
-                Timesheet(employee_id=1, project_id=1, hours_worked=40.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=1, project_id=2, hours_worked=40.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=2, project_id=1, hours_worked=35.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=2, project_id=2, hours_worked=45.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=3, project_id=1, hours_worked=38.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=3, project_id=2, hours_worked=42.0, date=date(2023, 10, 8)),
-                
-                # Marketing employees on marketing projects
-                Timesheet(employee_id=4, project_id=3, hours_worked=40.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=4, project_id=4, hours_worked=40.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=5, project_id=3, hours_worked=38.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=5, project_id=4, hours_worked=42.0, date=date(2023, 10, 8)),
-                
-                # Sales employees on sales projects
-                Timesheet(employee_id=6, project_id=5, hours_worked=45.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=6, project_id=6, hours_worked=40.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=7, project_id=5, hours_worked=40.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=7, project_id=6, hours_worked=40.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=8, project_id=5, hours_worked=38.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=8, project_id=6, hours_worked=42.0, date=date(2023, 10, 8)),
-                
-                # HR employees on HR projects
-                Timesheet(employee_id=9, project_id=7, hours_worked=40.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=9, project_id=7, hours_worked=40.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=10, project_id=7, hours_worked=38.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=10, project_id=7, hours_worked=42.0, date=date(2023, 10, 8)),
-                
-                # Finance employees on finance projects
-                Timesheet(employee_id=11, project_id=8, hours_worked=40.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=11, project_id=8, hours_worked=40.0, date=date(2023, 10, 8)),
-                Timesheet(employee_id=12, project_id=8, hours_worked=38.0, date=date(2023, 10, 1)),
-                Timesheet(employee_id=12, project_id=8, hours_worked=42.0, date=date(2023, 10, 8)),
-            ]
-            db.add_all(timesheets)
-            db.commit()
-            print(f"Created {len(timesheets)} sample timesheets")
+            # Create sample projects if they don't exist
+            if _is_empty(db, Project):
+                db.execute(insert(Project.__table__), PROJECT_ROWS)
+                print("Sample projects created")
         
+            # Create sample timesheets if they don't exist
+            if _is_empty(db, Timesheet):
+                timesheets = [
+                    {"employee_id": employee_id, "project_id": project_id, "hours_worked": hours_worked, "date": day}
+                    for employee_id, weeks in TIMESHEET_SPECS
+                    for day, (project_id, hours_worked) in zip(TIMESHEET_WEEKS, weeks)
+                ]
+                db.execute(insert(Timesheet.__table__), timesheets)
+                # Core inserts skip ORM events, so update the monthly hours rollup here
+                apply_hours_deltas(db.connection(), [
+                    (row["employee_id"], row["date"], row["hours_worked"]) for row in timesheets
+                ])
+                print(f"Created {len(timesheets)} sample timesheets")
+
+            if employee_count > 0:
+                _seed_load_data(db, employee_count, timesheets_per_employee)
+
         print("Database seeding completed")
-    
     except Exception as e:
         print(f"Error seeding database: {str(e)}")
-        db.rollback()
-    finally:
-        db.close()
 
 if __name__ == "__main__":
-    seed_db()
+    parser = argparse.ArgumentParser(description="Seed the database with sample data.")
+    parser.add_argument("--employees", type=int, default=0,
+                        help="generated employees to add on top of the sample data, for load testing")
+    parser.add_argument("--timesheets-per-employee", type=int, default=4,
+                        help="weekly timesheets to generate for each generated employee")
+    args = parser.parse_args()
+    seed_db(args.employees, args.timesheets_per_employee)
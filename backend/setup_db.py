@@ -4,37 +4,36 @@ Database setup script for Employee Productivity API.
 This script initializes the database and creates necessary tables.
 """
 
-import os
-import sys
-from sqlalchemy import text
-
-# Add the parent directory to the path so we can import the app modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sqlalchemy import inspect, text
 
 from app.db.base_class import Base
-from app.db.session import engine, SessionLocal
+from app.db.session import engine
 from app.core.config import settings
-from app.models import user, department, employee, project, timesheet
+from app.models import user, department, employee, project, timesheet, employee_hours
 
 
 def init_db():
     """Initialize the database and create tables."""
     print("Creating database tables...")
+    # The hours rollup is only maintained from timesheet writes, so a rollup
+    # table added to a database that already has timesheets must be backfilled
+    rollup_missing = not inspect(engine).has_table(employee_hours.EmployeeHoursMonthly.__tablename__)
     Base.metadata.create_all(bind=engine)
+    if rollup_missing:
+        with engine.begin() as connection:
+            employee_hours.rebuild_hours_rollup(connection)
     print("Database tables created successfully.")
     
-    # Test the connection
-    db = SessionLocal()
+    # Test the connection straight from the engine's pool; no Session needed for a ping
     try:
-        result = db.execute(text("SELECT 1")).fetchone()
-        if result:
+        with engine.connect() as connection:
+            result = connection.scalar(text("SELECT 1"))
+        if result == 1:
             print("Database connection test successful.")
         else:
             print("Database connection test failed.")
     except Exception as e:
         print(f"Error testing database connection: {e}")
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
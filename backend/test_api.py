@@ -1,11 +1,21 @@
 import requests
 import json
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+# One HTTP session for all calls, so the connection to the API is reused
+session = requests.Session()
 
 # Base URL for the API
 BASE_URL = "http://localhost:8000/api/v1"
 
+# Directory holding the sample CSV files to upload
+SAMPLE_DATA_DIR = Path("sample_data")
+
+# Chunk size for streaming report downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 # Test user credentials
 TEST_USER = {
     "email": "admin@example.com",
@@ -14,7 +24,7 @@ TEST_USER = {
 
 def login():
     """Login and get access token"""
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/auth/login",
         data={"username": TEST_USER["email"], "password": TEST_USER["password"]}
     )
@@ -27,12 +37,16 @@ def login():
         print(response.text)
         return None
 
-def test_analytics(token):
+def test_analytics(headers):
     """Test analytics endpoints"""
-    headers = {"Authorization": f"Bearer {token}"}
+    # The three endpoints are independent, so request them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        company = executor.submit(session.get, f"{BASE_URL}/analytics/company", headers=headers)
+        department = executor.submit(session.get, f"{BASE_URL}/analytics/departments/1", headers=headers)
+        employee = executor.submit(session.get, f"{BASE_URL}/analytics/employees/1", headers=headers)
     
     # Test company analytics
-    response = requests.get(f"{BASE_URL}/analytics/company", headers=headers)
+    response = company.result()
     if response.status_code == 200:
         print("Company analytics: Success")
         data = response.json()
@@ -44,7 +58,7 @@ def test_analytics(token):
         print(response.text)
     
     # Test department analytics (assuming department ID 1 exists)
-    response = requests.get(f"{BASE_URL}/analytics/departments/1", headers=headers)
+    response = department.result()
     if response.status_code == 200:
         print("Department analytics: Success")
         data = response.json()
@@ -56,7 +70,7 @@ def test_analytics(token):
         print(response.text)
     
     # Test employee analytics (assuming employee ID 1 exists)
-    response = requests.get(f"{BASE_URL}/analytics/employees/1", headers=headers)
+    response = employee.result()
     if response.status_code == 200:
         print("Employee analytics: Success")
         data = response.json()
@@ -67,103 +81,80 @@ def test_analytics(token):
         print(f"Employee analytics failed: {response.status_code}")
         print(response.text)
 
-def test_csv_upload(token):
-    """Test CSV upload endpoints"""
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    # Test employee CSV upload
-    employee_csv_path = os.path.join("sample_data", "employees.csv")
-    if os.path.exists(employee_csv_path):
-        with open(employee_csv_path, "rb") as f:
-            files = {"file": ("employees.csv", f, "text/csv")}
-            response = requests.post(
-                f"{BASE_URL}/upload/employees",
+def _upload(headers, name):
+    """Post sample_data/<name>.csv to its upload endpoint; None if the file is missing"""
+    try:
+        with open(SAMPLE_DATA_DIR / f"{name}.csv", "rb") as f:
+            files = {"file": (f"{name}.csv", f, "text/csv")}
+            return session.post(
+                f"{BASE_URL}/upload/{name}",
                 headers=headers,
                 files=files
             )
-            
-            if response.status_code == 200:
-                print("Employee CSV upload: Success")
-                print(response.json())
-            else:
-                print(f"Employee CSV upload failed: {response.status_code}")
-                print(response.text)
+    except FileNotFoundError:
+        return None
+
+def print_upload_result(label, name, response):
+    if response is None:
+        print(f"{label} CSV file not found: {SAMPLE_DATA_DIR / f'{name}.csv'}")
+    elif response.status_code == 200:
+        print(f"{label} CSV upload: Success")
+        print(response.json())
     else:
-        print(f"Employee CSV file not found: {employee_csv_path}")
+        print(f"{label} CSV upload failed: {response.status_code}")
+        print(response.text)
+
+def test_csv_upload(headers):
+    """Test CSV upload endpoints"""
+    # Employees and projects are uploaded concurrently; timesheets reference
+    # both, so they go last
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        employees = executor.submit(_upload, headers, "employees")
+        projects = executor.submit(_upload, headers, "projects")
+    
+    # Test employee CSV upload
+    print_upload_result("Employee", "employees", employees.result())
     
     # Test project CSV upload
-    project_csv_path = os.path.join("sample_data", "projects.csv")
-    if os.path.exists(project_csv_path):
-        with open(project_csv_path, "rb") as f:
-            files = {"file": ("projects.csv", f, "text/csv")}
-            response = requests.post(
-                f"{BASE_URL}/upload/projects",
-                headers=headers,
-                files=files
-            )
-            
-            if response.status_code == 200:
-                print("Project CSV upload: Success")
-                print(response.json())
-            else:
-                print(f"Project CSV upload failed: {response.status_code}")
-                print(response.text)
-    else:
-        print(f"Project CSV file not found: {project_csv_path}")
+    print_upload_result("Project", "projects", projects.result())
     
     # Test timesheet CSV upload
-    timesheet_csv_path = os.path.join("sample_data", "timesheets.csv")
-    if os.path.exists(timesheet_csv_path):
-        with open(timesheet_csv_path, "rb") as f:
-            files = {"file": ("timesheets.csv", f, "text/csv")}
-            response = requests.post(
-                f"{BASE_URL}/upload/timesheets",
-                headers=headers,
-                files=files
-            )
-            
-            if response.status_code == 200:
-                print("Timesheet CSV upload: Success")
-                print(response.json())
-            else:
-                print(f"Timesheet CSV upload failed: {response.status_code}")
-                print(response.text)
-    else:
-        print(f"Timesheet CSV file not found: {timesheet_csv_path}")
+    print_upload_result("Timesheet", "timesheets", _upload(headers, "timesheets"))
+
+def save_response(response, filename):
+    """Stream a response body to disk in chunks instead of buffering it whole"""
+    with response, open(filename, "wb") as f:
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
 
-def test_reports(token):
+def test_reports(headers):
     """Test report generation endpoints"""
-    headers = {"Authorization": f"Bearer {token}"}
+    # Both reports are saved under the same timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pdf = executor.submit(session.get, f"{BASE_URL}/reports/generate?report_type=pdf", headers=headers, stream=True)
+        excel = executor.submit(session.get, f"{BASE_URL}/reports/generate?report_type=excel", headers=headers, stream=True)
     
     # Test PDF report generation
-    response = requests.get(
-        f"{BASE_URL}/reports/generate?report_type=pdf",
-        headers=headers
-    )
+    response = pdf.result()
     
     if response.status_code == 200:
         # Save the PDF report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"test_report_{timestamp}.pdf"
-        with open(filename, "wb") as f:
-            f.write(response.content)
+        save_response(response, filename)
         print(f"PDF report generated: {filename}")
     else:
         print(f"PDF report generation failed: {response.status_code}")
         print(response.text)
     
     # Test Excel report generation
-    response = requests.get(
-        f"{BASE_URL}/reports/generate?report_type=excel",
-        headers=headers
-    )
+    response = excel.result()
     
     if response.status_code == 200:
         # Save the Excel report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"test_report_{timestamp}.xlsx"
-        with open(filename, "wb") as f:
-            f.write(response.content)
+        save_response(response, filename)
         print(f"Excel report generated: {filename}")
     else:
         print(f"Excel report generation failed: {response.status_code}")
@@ -178,15 +169,16 @@ def main():
     if not token:
         print("Authentication failed. Exiting tests.")
         return
+    headers = {"Authorization": f"Bearer {token}"}
     
     print("\n=== Testing Analytics ===")
-    test_analytics(token)
+    test_analytics(headers)
     
     print("\n=== Testing CSV Uploads ===")
-    test_csv_upload(token)
+    test_csv_upload(headers)
     
     print("\n=== Testing Reports ===")
-    test_reports(token)
+    test_reports(headers)
     
     print("\nTests completed.")
 
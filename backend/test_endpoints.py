@@ -1,19 +1,22 @@
 import requests
 import os
 
+# One HTTP session for all calls, so the connection to the API is reused
+session = requests.Session()
+
 # Base URL for the API
 BASE_URL = "http://127.0.0.1:8000"
 
 def test_root():
     """Test the root endpoint"""
-    response = requests.get(f"{BASE_URL}/")
+    response = session.get(f"{BASE_URL}/")
     print(f"Root endpoint: {response.status_code}")
     print(response.json())
     print()
 
 def test_db_connection():
     """Test the database connection"""
-    response = requests.get(f"{BASE_URL}/test-db")
+    response = session.get(f"{BASE_URL}/test-db")
     print(f"Database connection: {response.status_code}")
     print(response.json())
     print()
@@ -27,7 +30,7 @@ def test_file_upload():
     
     # Upload the file
     with open(test_file_path, "rb") as f:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/test-upload",
             files={"file": ("test_upload.csv", f, "text/csv")}
         )
@@ -42,13 +45,14 @@ def test_file_upload():
 
 def test_report_generation():
     """Test report generation"""
-    response = requests.get(f"{BASE_URL}/test-report")
+    response = session.get(f"{BASE_URL}/test-report", stream=True)
     print(f"Report generation: {response.status_code}")
     
     if response.status_code == 200:
-        # Save the report
-        with open("downloaded_test_report.txt", "wb") as f:
-            f.write(response.content)
+        # Save the report, streaming it to disk in chunks
+        with response, open("downloaded_test_report.txt", "wb") as f:
+            for chunk in response.iter_content(64 * 1024):
+                f.write(chunk)
         print("Report downloaded successfully")
     else:
         print(response.json())
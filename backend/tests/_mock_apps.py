@@ -0,0 +1,107 @@
+"""
+Mock FastAPI apps shared by the prediction and report tests.
+
+They are built once at import, so each test process (or xdist worker)
+constructs every app a single time.
+"""
+import os
+
+from fastapi import FastAPI, Query
+from fastapi.responses import FileResponse
+
+# Create a test app with mock prediction endpoints
+predictions_app = FastAPI()
+
+# Mock prediction data
+MOCK_PREDICTION_RESULT = {
+    "success": True,
+    "department_id": 1,
+    "department_name": "Engineering",
+    "prediction_date": "2023-10-28",
+    "next_month": 11,
+    "current_roi": 0.75,
+    "predicted_roi": 0.82,
+    "roi_trend_percent": 9.33,
+    "roi_confidence": 0.85,
+    "current_cost": 350000.0,
+    "predicted_cost": 360000.0,
+    "cost_trend_percent": 2.86,
+    "cost_confidence": 0.9,
+    "recommendations": [
+        "ROI is projected to increase significantly. Consider expanding successful projects.",
+        "Costs are projected to remain stable. Continue monitoring for any changes."
+    ]
+}
+
+MOCK_TRAINING_RESULT = {
+    "success": True,
+    "department_id": 1,
+    "roi_model_metrics": {
+        "mse": 0.0023,
+        "r2": 0.87
+    },
+    "cost_model_metrics": {
+        "mse": 1500000.0,
+        "r2": 0.92
+    },
+    "roi_model_path": "/app/models/department_1_roi_model.joblib",
+    "cost_model_path": "/app/models/department_1_cost_model.joblib"
+}
+
+@predictions_app.get("/api/v1/predict/department/{department_id}")
+def predict_department_performance(department_id: int):
+    if department_id != 1:
+        return {"detail": "Department not found"}
+    return MOCK_PREDICTION_RESULT
+
+@predictions_app.post("/api/v1/predict/department/{department_id}/train")
+def train_department_model(department_id: int):
+    if department_id != 1:
+        return {"detail": "Department not found"}
+    return {
+        "message": "Department prediction models trained successfully",
+        "department_id": department_id,
+        "department_name": "Engineering",
+        "roi_model_metrics": MOCK_TRAINING_RESULT["roi_model_metrics"],
+        "cost_model_metrics": MOCK_TRAINING_RESULT["cost_model_metrics"],
+    }
+
+
+# Create a test app with mock report endpoints
+reports_app = FastAPI()
+
+# Actual file paths
+TEST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TXT_PATH = os.path.join(TEST_DIR, "reports", "test_report.txt")
+CSV_PATH = os.path.join(TEST_DIR, "reports", "test_report.csv")
+PDF_PATH = os.path.join(TEST_DIR, "reports", "test_report.pdf")
+EXCEL_PATH = os.path.join(TEST_DIR, "reports", "test_report.xlsx")
+
+@reports_app.get("/api/v1/reports/generate")
+def generate_report(report_type: str = Query(...)):
+    if report_type == "txt":
+        return FileResponse(
+            path=TXT_PATH,
+            filename="test_report.txt",
+            media_type="text/plain"
+        )
+    elif report_type == "csv":
+        return FileResponse(
+            path=CSV_PATH,
+            filename="test_report.csv",
+            media_type="text/csv"
+        )
+    elif report_type == "pdf":
+        return FileResponse(
+            path=PDF_PATH,
+            filename="test_report.pdf",
+            media_type="application/pdf"
+        )
+    elif report_type == "excel":
+        return FileResponse(
+            path=EXCEL_PATH,
+            filename="test_report.xlsx",
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+    else:
+        return {"detail": f"Invalid report type: {report_type}. Use 'txt', 'csv', 'pdf', or 'excel'."}
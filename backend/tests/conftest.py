@@ -15,7 +15,133 @@ def health_check():
     return {"status": "healthy"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the app."""
-    return TestClient(app)
+    """Create a test client for the app, shared by the whole session (the app is stateless)."""
+    # Entering the client once keeps a single portal (event loop thread) open for
+    # every request, instead of one per call
+    with TestClient(app) as client:
+        yield client
+
+
+# Fixtures for tests against the real API, each on a throwaway SQLite database
+
+TEST_USERS = {
+    "admin": ("admin@example.com", "adminpassword", "Admin User", "ADMIN"),
+    "department_head": ("head@example.com", "headpassword", "Department Head", "DEPARTMENT_HEAD"),
+    "user": ("test@example.com", "testpassword", "Test User", "ANALYST"),
+}
+
+
+@pytest.fixture(scope="session")
+def password_hashes():
+    """bcrypt hashes of the test users' passwords, computed once (hashing is deliberately slow)"""
+    from app.core.security import get_password_hash
+
+    return {role: get_password_hash(password) for role, (_, password, _, _) in TEST_USERS.items()}
+
+
+@pytest.fixture
+def db_sessionmaker(tmp_path, password_hashes):
+    """Sessions on a fresh SQLite database seeded with departments, employees, projects and users"""
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import sessionmaker
+
+    from app.db.base import Base
+    from app.models.department import Department
+    from app.models.employee import Employee
+    from app.models.project import Project
+    from app.models.user import User, UserRole
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(Department.__table__), [
+            {"id": 1, "name": "Engineering", "budget": 500000.0},
+            {"id": 2, "name": "Marketing", "budget": 300000.0},
+        ])
+        connection.execute(insert(Employee.__table__), [
+            {"id": 1, "name": "John Smith", "department_id": 1, "salary": 120000.0, "revenue_generated": 250000.0},
+            {"id": 2, "name": "Jane Doe", "department_id": 1, "salary": 110000.0, "revenue_generated": 220000.0},
+            {"id": 3, "name": "Bob Johnson", "department_id": 2, "salary": 90000.0, "revenue_generated": 150000.0},
+        ])
+        connection.execute(insert(Project.__table__), [
+            {"id": 1, "name": "Product Redesign", "department_id": 1, "cost": 50000.0, "revenue": 150000.0},
+            {"id": 2, "name": "Mobile App Development", "department_id": 1, "cost": 80000.0, "revenue": 200000.0},
+            {"id": 3, "name": "Marketing Campaign", "department_id": 2, "cost": 30000.0, "revenue": 90000.0},
+        ])
+        connection.execute(insert(User.__table__), [
+            {
+                "email": email,
+                "hashed_password": password_hashes[key],
+                "full_name": full_name,
+                "role": UserRole[role],
+                "is_active": True,
+            }
+            for key, (email, _, full_name, role) in TEST_USERS.items()
+        ])
+
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def api_client(db_sessionmaker):
+    """Test client for the real app, with get_db pointed at the test database"""
+    # app.main mounts the reports directory as static files at import
+    os.makedirs("reports", exist_ok=True)
+    from app.db.session import get_db
+    from app.main import app
+
+    def override_get_db():
+        db = db_sessionmaker()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    # Not entered as a context manager: the lifespan would create tables on the configured database
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def _token_headers(db_sessionmaker, key):
+    from app.core.security import create_access_token
+    from app.models.user import User
+
+    with db_sessionmaker() as db:
+        user_id = db.query(User.id).filter(User.email == TEST_USERS[key][0]).scalar()
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+@pytest.fixture
+def test_user(db_sessionmaker):
+    """The seeded analyst user (test@example.com / testpassword)"""
+    from app.models.user import User
+
+    with db_sessionmaker() as db:
+        return db.query(User).filter(User.email == TEST_USERS["user"][0]).one()
+
+
+@pytest.fixture
+def admin_token_headers(db_sessionmaker):
+    return _token_headers(db_sessionmaker, "admin")
+
+
+@pytest.fixture
+def department_head_token_headers(db_sessionmaker):
+    return _token_headers(db_sessionmaker, "department_head")
+
+
+@pytest.fixture
+def user_token_headers(db_sessionmaker):
+    return _token_headers(db_sessionmaker, "user")
+
+
+@pytest.fixture
+def refresh_token(test_user):
+    from app.core.security import create_refresh_token
+
+    return create_refresh_token(test_user.id)
@@ -1,6 +1,8 @@
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.testclient import TestClient
 
 # Create a test app with mock analytics endpoints
@@ -62,23 +64,103 @@ MOCK_EMPLOYEE_ANALYTICS = {
     "alerts": []
 }
 
+# The mock responses are constant, so encode them once instead of on every request
+_COMPANY_JSON = json.dumps(MOCK_COMPANY_ANALYTICS).encode()
+_DEPARTMENT_JSON = json.dumps(MOCK_DEPARTMENT_ANALYTICS).encode()
+_EMPLOYEE_JSON = json.dumps(MOCK_EMPLOYEE_ANALYTICS).encode()
+
+# Fields each analytics response must include
+REQUIRED_COMPANY_FIELDS = {
+    "department_count", "employee_count", "project_count", "total_salary",
+    "total_project_cost", "total_cost", "total_revenue", "profit", "profit_margin",
+    "budget_utilization", "roi", "productivity_index", "alerts",
+}
+REQUIRED_DEPARTMENT_FIELDS = {
+    "department_id", "department_name", "budget", "employee_count", "project_count",
+    "total_salary_cost", "total_project_cost", "total_revenue", "profit", "profit_margin",
+    "budget_utilization", "roi", "productivity_index", "alerts",
+}
+REQUIRED_EMPLOYEE_FIELDS = {
+    "employee_id", "employee_name", "department_id", "department_name", "salary",
+    "revenue_generated", "profit", "roi", "productivity_index", "alerts",
+}
+
+NUMBER = (int, float)
+COMPANY_FIELD_TYPES = {
+    "department_count": int,
+    "employee_count": int,
+    "project_count": int,
+    "total_salary": NUMBER,
+    "total_project_cost": NUMBER,
+    "total_revenue": NUMBER,
+    "profit": NUMBER,
+    "profit_margin": NUMBER,
+    "budget_utilization": NUMBER,
+    "roi": NUMBER,
+    "productivity_index": NUMBER,
+    "alerts": list,
+}
+
+
+def assert_has_fields(data, required):
+    missing = required - data.keys()
+    assert not missing, f"missing fields: {sorted(missing)}"
+
+
+def check_company_invariants(data):
+    """Company-wide analytics: field types and logical relationships"""
+    wrong_types = {
+        field: type(data[field]).__name__
+        for field, expected in COMPANY_FIELD_TYPES.items()
+        if not isinstance(data[field], expected)
+    }
+    assert not wrong_types, f"unexpected field types: {wrong_types}"
+    
+    assert data["total_cost"] == data["total_salary"] + data["total_project_cost"]
+    assert data["profit"] == data["total_revenue"] - data["total_cost"]
+    if data["total_revenue"] > 0:
+        assert abs(data["profit_margin"] - (data["profit"] / data["total_revenue"] * 100)) < 0.01
+
+
+def check_department_invariants(data):
+    """Department analytics: specific values and logical relationships"""
+    assert data["department_id"] == 1
+    assert data["department_name"] == "Engineering"
+    assert data["budget"] == 500000.0
+    
+    assert data["profit"] == data["total_revenue"] - (data["total_salary_cost"] + data["total_project_cost"])
+
+
+def check_employee_invariants(data):
+    """Employee analytics: specific values and logical relationships"""
+    assert data["employee_id"] == 1
+    assert data["employee_name"] == "John Smith"
+    assert data["department_id"] == 1
+    assert data["department_name"] == "Engineering"
+    assert data["salary"] == 120000.0
+    assert data["revenue_generated"] == 250000.0
+    
+    assert data["profit"] == data["revenue_generated"] - data["salary"]
+    assert abs(data["roi"] - ((data["revenue_generated"] - data["salary"]) / data["salary"])) < 0.01
+
+
 @app.get("/api/v1/analytics/company")
 def get_company_analytics():
-    return MOCK_COMPANY_ANALYTICS
+    return Response(content=_COMPANY_JSON, media_type="application/json")
 
 @app.get("/api/v1/analytics/departments/{department_id}")
 def get_department_analytics(department_id: int):
     if department_id != 1:
         return {"detail": "Department not found"}
-    return MOCK_DEPARTMENT_ANALYTICS
+    return Response(content=_DEPARTMENT_JSON, media_type="application/json")
 
 @app.get("/api/v1/analytics/employees/{employee_id}")
 def get_employee_analytics(employee_id: int):
     if employee_id != 1:
         return {"detail": "Employee not found"}
-    return MOCK_EMPLOYEE_ANALYTICS
+    return Response(content=_EMPLOYEE_JSON, media_type="application/json")
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def analytics_client():
     return TestClient(app)
 
@@ -87,106 +169,21 @@ def analytics_client():
 class TestAnalytics:
     """Test analytics functionality with mocks"""
     
-    def test_company_analytics(self, analytics_client):
-        """Test company-wide analytics"""
-        response = analytics_client.get("/api/v1/analytics/company")
-        assert response.status_code == 200
-        
-        data = response.json()
-        # Check for required fields
-        assert "department_count" in data
-        assert "employee_count" in data
-        assert "project_count" in data
-        assert "total_salary" in data
-        assert "total_project_cost" in data
-        assert "total_cost" in data
-        assert "total_revenue" in data
-        assert "profit" in data
-        assert "profit_margin" in data
-        assert "budget_utilization" in data
-        assert "roi" in data
-        assert "productivity_index" in data
-        assert "alerts" in data
-        
-        # Check for correct data types
-        assert isinstance(data["department_count"], int)
-        assert isinstance(data["employee_count"], int)
-        assert isinstance(data["project_count"], int)
-        assert isinstance(data["total_salary"], (int, float))
-        assert isinstance(data["total_project_cost"], (int, float))
-        assert isinstance(data["total_revenue"], (int, float))
-        assert isinstance(data["profit"], (int, float))
-        assert isinstance(data["profit_margin"], (int, float))
-        assert isinstance(data["budget_utilization"], (int, float))
-        assert isinstance(data["roi"], (int, float))
-        assert isinstance(data["productivity_index"], (int, float))
-        assert isinstance(data["alerts"], list)
-        
-        # Check for logical relationships
-        assert data["total_cost"] == data["total_salary"] + data["total_project_cost"]
-        assert data["profit"] == data["total_revenue"] - data["total_cost"]
-        if data["total_revenue"] > 0:
-            assert abs(data["profit_margin"] - (data["profit"] / data["total_revenue"] * 100)) < 0.01
-    
-    def test_department_analytics(self, analytics_client):
-        """Test department analytics"""
-        response = analytics_client.get("/api/v1/analytics/departments/1")
+    @pytest.mark.parametrize("path,required,check_invariants", [
+        pytest.param("/api/v1/analytics/company", REQUIRED_COMPANY_FIELDS, check_company_invariants, id="company"),
+        pytest.param("/api/v1/analytics/departments/1", REQUIRED_DEPARTMENT_FIELDS, check_department_invariants, id="department"),
+        pytest.param("/api/v1/analytics/employees/1", REQUIRED_EMPLOYEE_FIELDS, check_employee_invariants, id="employee"),
+    ])
+    def test_analytics_endpoint(self, analytics_client, path, required, check_invariants):
+        """Test company, department and employee analytics"""
+        response = analytics_client.get(path)
         assert response.status_code == 200
         
         data = response.json()
         # Check for required fields
-        assert "department_id" in data
-        assert "department_name" in data
-        assert "budget" in data
-        assert "employee_count" in data
-        assert "project_count" in data
-        assert "total_salary_cost" in data
-        assert "total_project_cost" in data
-        assert "total_revenue" in data
-        assert "profit" in data
-        assert "profit_margin" in data
-        assert "budget_utilization" in data
-        assert "roi" in data
-        assert "productivity_index" in data
-        assert "alerts" in data
-        
-        # Check specific values
-        assert data["department_id"] == 1
-        assert data["department_name"] == "Engineering"
-        assert data["budget"] == 500000.0
-        
-        # Check for logical relationships
-        assert data["profit"] == data["total_revenue"] - (data["total_salary_cost"] + data["total_project_cost"])
-    
-    def test_employee_analytics(self, analytics_client):
-        """Test employee analytics"""
-        response = analytics_client.get("/api/v1/analytics/employees/1")
-        assert response.status_code == 200
-        
-        data = response.json()
-        # Check for required fields
-        assert "employee_id" in data
-        assert "employee_name" in data
-        assert "department_id" in data
-        assert "department_name" in data
-        assert "salary" in data
-        assert "revenue_generated" in data
-        assert "profit" in data
-        assert "roi" in data
-        assert "productivity_index" in data
-        assert "alerts" in data
-        
-        # Check specific values
-        assert data["employee_id"] == 1
-        assert data["employee_name"] == "John Smith"
-        assert data["department_id"] == 1
-        assert data["department_name"] == "Engineering"
-        assert data["salary"] == 120000.0
-        assert data["revenue_generated"] == 250000.0
+        assert_has_fields(data, required)
         
-        # Check for logical relationships
-        assert data["profit"] == data["revenue_generated"] - data["salary"]
-        assert abs(data["roi"] - ((data["revenue_generated"] - data["salary"]) / data["salary"])) < 0.01
+        check_invariants(data)
     
     def test_nonexistent_department(self, analytics_client):
         """Test analytics for nonexistent department"""
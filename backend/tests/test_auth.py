@@ -3,13 +3,13 @@ from fastapi.testclient import TestClient
 
 
 @pytest.mark.auth
-def test_login(client, test_user):
+def test_login(api_client, test_user):
     """Test user login"""
     login_data = {
         "username": "test@example.com",
         "password": "testpassword"
     }
-    response = client.post("/api/v1/auth/login", data=login_data)
+    response = api_client.post("/api/v1/auth/login", data=login_data)
     assert response.status_code == 200
     
     # Check response structure
@@ -21,33 +21,33 @@ def test_login(client, test_user):
 
 
 @pytest.mark.auth
-def test_login_wrong_password(client, test_user):
+def test_login_wrong_password(api_client, test_user):
     """Test login with wrong password"""
     login_data = {
         "username": "test@example.com",
         "password": "wrongpassword"
     }
-    response = client.post("/api/v1/auth/login", data=login_data)
+    response = api_client.post("/api/v1/auth/login", data=login_data)
     assert response.status_code == 401
     assert "detail" in response.json()
 
 
 @pytest.mark.auth
-def test_login_nonexistent_user(client):
+def test_login_nonexistent_user(api_client):
     """Test login with nonexistent user"""
     login_data = {
         "username": "nonexistent@example.com",
         "password": "password"
     }
-    response = client.post("/api/v1/auth/login", data=login_data)
+    response = api_client.post("/api/v1/auth/login", data=login_data)
     assert response.status_code == 401
     assert "detail" in response.json()
 
 
 @pytest.mark.auth
-def test_get_current_user(client, user_token_headers):
+def test_get_current_user(api_client, user_token_headers):
     """Test getting current user info"""
-    response = client.get("/api/v1/auth/me", headers=user_token_headers)
+    response = api_client.get("/api/v1/auth/me", headers=user_token_headers)
     assert response.status_code == 200
     
     user_data = response.json()
@@ -58,17 +58,17 @@ def test_get_current_user(client, user_token_headers):
 
 
 @pytest.mark.auth
-def test_get_current_user_invalid_token(client):
+def test_get_current_user_invalid_token(api_client):
     """Test getting current user with invalid token"""
     headers = {"Authorization": "Bearer invalidtoken"}
-    response = client.get("/api/v1/auth/me", headers=headers)
+    response = api_client.get("/api/v1/auth/me", headers=headers)
     assert response.status_code == 401
 
 
 @pytest.mark.auth
-def test_refresh_token(client, refresh_token):
+def test_refresh_token(api_client, refresh_token):
     """Test refreshing access token"""
-    response = client.post(
+    response = api_client.post(
         "/api/v1/auth/refresh",
         json={"refresh_token": refresh_token}
     )
@@ -81,9 +81,9 @@ def test_refresh_token(client, refresh_token):
 
 
 @pytest.mark.auth
-def test_refresh_token_invalid(client):
+def test_refresh_token_invalid(api_client):
     """Test refreshing with invalid token"""
-    response = client.post(
+    response = api_client.post(
         "/api/v1/auth/refresh",
         json={"refresh_token": "invalid_token"}
     )
@@ -91,7 +91,7 @@ def test_refresh_token_invalid(client):
 
 
 @pytest.mark.auth
-def test_register_user(client):
+def test_register_user(api_client):
     """Test user registration"""
     user_data = {
         "email": "newuser@example.com",
@@ -99,7 +99,7 @@ def test_register_user(client):
         "full_name": "New User",
         "role": "ANALYST"
     }
-    response = client.post("/api/v1/auth/register", json=user_data)
+    response = api_client.post("/api/v1/auth/register", json=user_data)
     assert response.status_code == 200
     
     new_user = response.json()
@@ -110,7 +110,7 @@ def test_register_user(client):
 
 
 @pytest.mark.auth
-def test_register_existing_user(client, test_user):
+def test_register_existing_user(api_client, test_user):
     """Test registering with existing email"""
     user_data = {
         "email": "test@example.com",  # Already exists
@@ -118,6 +118,6 @@ def test_register_existing_user(client, test_user):
         "full_name": "Another User",
         "role": "ANALYST"
     }
-    response = client.post("/api/v1/auth/register", json=user_data)
+    response = api_client.post("/api/v1/auth/register", json=user_data)
     assert response.status_code == 400
     assert "detail" in response.json()
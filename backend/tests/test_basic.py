@@ -3,6 +3,13 @@ Basic tests that don't require complex fixtures or database access.
 """
 import pytest
 
+_SQUARE_CASES = (
+    (2, 4),
+    (3, 9),
+    (4, 16),
+    (5, 25),
+)
+
 
 def test_addition():
     """Simple test to verify pytest is working"""
@@ -16,15 +23,7 @@ def test_string_operations():
     assert "WORLD".lower() == "world"
 
 
-@pytest.mark.parametrize(
-    "input_value,expected",
-    [
-        (2, 4),
-        (3, 9),
-        (4, 16),
-        (5, 25),
-    ]
-)
+@pytest.mark.parametrize("input_value,expected", _SQUARE_CASES)
 def test_square(input_value, expected):
     """Test squaring numbers with parameterization"""
     assert input_value ** 2 == expected
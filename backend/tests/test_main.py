@@ -20,6 +20,7 @@ def test_health_check(client):
 
 
 @pytest.mark.unit
+@pytest.mark.slow
 def test_docs_endpoint(client):
     """Test that the docs endpoint is accessible"""
     response = client.get("/docs")
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from app.services import reports_service
+
+
+@pytest.fixture
+def reports_dir(tmp_path, monkeypatch):
+    """Run report generation in a scratch working directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "reports"
+
+
+@pytest.fixture
+def job_sessions(db_sessionmaker, monkeypatch):
+    """Point background report jobs at the test database"""
+    monkeypatch.setattr(reports_service, "SessionLocal", db_sessionmaker)
+
+
+def test_report_files_are_unique(reports_dir):
+    """Test that reports created in the same second get different files"""
+    first = reports_service._report_file("pdf")
+    second = reports_service._report_file("pdf")
+    assert first[0] != second[0]
+    assert first[1] != second[1]
+
+
+def test_report_job_round_trip(reports_dir, job_sessions):
+    """Test that a report job's status is readable from its status file before and after it runs"""
+    task_id = reports_service.create_report_job("excel")
+    assert reports_service.get_report_job(task_id)["status"] == "pending"
+    
+    reports_service.run_report_job(task_id)
+    
+    job = reports_service.get_report_job(task_id)
+    assert job["status"] == "completed"
+    assert os.path.exists(job["files"]["excel"]["filepath"])
+
+
+def test_unknown_report_job(reports_dir):
+    """Test that unknown or malformed task ids are not found"""
+    assert reports_service.get_report_job("0" * 32) is None
+    assert reports_service.get_report_job("../../etc/passwd") is None
+
+
+def test_generate_reports_from_one_fetch(reports_dir, db_sessionmaker, monkeypatch):
+    """Test that building PDF and Excel together fetches the analytics once"""
+    fetch_calls = []
+    fetch_report_data = reports_service._fetch_report_data
+    
+    def counting_fetch(db, formats):
+        fetch_calls.append(formats)
+        return fetch_report_data(db, formats)
+    
+    monkeypatch.setattr(reports_service, "_fetch_report_data", counting_fetch)
+    
+    with db_sessionmaker() as db:
+        files = reports_service.generate_reports(db, ("pdf", "excel"))
+    
+    assert fetch_calls == [("pdf", "excel")]
+    assert set(files) == {"pdf", "excel"}
+    for _, filepath in files.values():
+        assert os.path.getsize(filepath) > 0
+
+
+def test_report_job_both_formats(reports_dir, job_sessions, api_client, user_token_headers):
+    """Test a 'both' report job through the API, downloading each file by format"""
+    response = api_client.post(
+        "/api/v1/reports/jobs", params={"report_type": "both"}, headers=user_token_headers
+    )
+    assert response.status_code == 202
+    task_id = response.json()["task_id"]
+    
+    # TestClient runs the background task before returning, so the job is done
+    response = api_client.get(f"/api/v1/reports/jobs/{task_id}", headers=user_token_headers)
+    assert response.status_code == 200
+    assert response.json()["formats"] == ["pdf", "excel"]
+    
+    for report_format, media_type in (
+        ("pdf", "application/pdf"),
+        ("excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ):
+        response = api_client.get(
+            f"/api/v1/reports/jobs/{task_id}", params={"format": report_format}, headers=user_token_headers
+        )
+        assert response.status_code == 200, report_format
+        assert response.headers["content-type"] == media_type
@@ -0,0 +1,25 @@
+import pytest
+
+# 1000 employee rows, built once at import
+EMPLOYEES_1000_CSV_BYTES = b"name,department_id,salary,revenue_generated\n" + b"\n".join(
+    f"Employee {i},1,{90000 + i},{180000 + i}".encode() for i in range(1, 1001)
+)
+
+
+@pytest.mark.benchmark
+def test_benchmark_upload_employees_csv(benchmark, api_client, department_head_token_headers):
+    """Benchmark a 1000-row employee CSV upload"""
+    # Raw bytes rather than a file object, so every round sends the whole file
+    response = benchmark.pedantic(
+        api_client.post,
+        args=("/api/v1/upload/employees",),
+        kwargs={
+            "files": {"file": ("employees.csv", EMPLOYEES_1000_CSV_BYTES, "text/csv")},
+            "headers": department_head_token_headers,
+        },
+        rounds=5,
+        iterations=1,
+        warmup_rounds=1,
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1000
@@ -1,46 +1,59 @@
 import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
 
+from app.services import upload_service
 
-@pytest.mark.parametrize(
-    "entity,csv_content,expected_status",
-    [
-        (
-            "employees",
-            "name,department_id,salary,revenue_generated\nTest Employee,1,90000,180000",
-            200
-        ),
-        (
-            "projects",
-            "name,department_id,cost,revenue\nTest Project,1,50000,150000",
-            200
-        ),
-        (
-            "timesheets",
-            "employee_id,project_id,hours_worked,date\n1,1,8,2023-10-28",
-            200
-        ),
-        (
-            "invalid",
-            "test,data\n1,2",
-            400
-        ),
-    ]
+# CSV payloads, encoded once at import
+EMPLOYEES_CSV_BYTES = b"name,department_id,salary,revenue_generated\nTest Employee,1,90000,180000"
+PROJECTS_CSV_BYTES = b"name,department_id,cost,revenue\nTest Project,1,50000,150000"
+TIMESHEETS_CSV_BYTES = b"employee_id,project_id,hours_worked,date\n1,1,8,2023-10-28"
+INVALID_CSV_BYTES = b"test,data\n1,2"
+
+FIVE_EMPLOYEES_CSV_BYTES = (
+    b"name,department_id,salary,revenue_generated\n"
+    b"Employee 1,1,90000,180000\n"
+    b"Employee 2,1,95000,190000\n"
+    b"Employee 3,2,85000,170000\n"
+    b"Employee 4,2,80000,160000\n"
+    b"Employee 5,1,100000,200000"
 )
-def test_upload_csv(entity, csv_content, expected_status, client, department_head_token_headers):
-    """Test uploading CSV files for different entities"""
+
+EMPLOYEES_WITH_ERRORS_CSV_BYTES = (
+    b"name,department_id,salary,revenue_generated\n"
+    b"Employee 1,invalid,90000,180000\n"
+    b"Employee 2,1,-95000,190000\n"
+    b"Employee 3,,85000,170000"
+)
+
+WRONG_HEADERS_CSV_BYTES = b"foo,bar\n1,2\n3,4"
+
+
+_UPLOAD_CASES = (
+    ("employees", EMPLOYEES_CSV_BYTES, 200),
+    ("projects", PROJECTS_CSV_BYTES, 200),
+    ("timesheets", TIMESHEETS_CSV_BYTES, 200),
+    ("invalid", INVALID_CSV_BYTES, 400),
+)
+
+
+def _upload_csv(api_client, headers, entity, csv_bytes):
     # Create a test CSV file
-    file = io.BytesIO(csv_content.encode())
+    file = io.BytesIO(csv_bytes)
     file.name = f"test_{entity}.csv"
     
-    response = client.post(
+    return api_client.post(
         f"/api/v1/upload/{entity}",
         files={"file": (file.name, file, "text/csv")},
-        headers=department_head_token_headers
+        headers=headers
     )
-    assert response.status_code == expected_status
+
+
+def _check_upload_response(response, entity, expected_status):
+    assert response.status_code == expected_status, entity
     
     if expected_status == 200:
         data = response.json()
@@ -49,13 +62,46 @@ def test_upload_csv(entity, csv_content, expected_status, client, department_hea
         assert "failed" in data
 
 
-def test_upload_non_csv_file(client, department_head_token_headers):
+@pytest.fixture
+def mock_import_employees(monkeypatch):
+    """Replace the employee import service; tests set the return value"""
+    mock = MagicMock()
+    monkeypatch.setattr("app.services.upload_service.import_employees", mock)
+    return mock
+
+
+def test_upload_csv_all(api_client, department_head_token_headers):
+    """Test uploading CSV files for every entity, with the uploads in flight together"""
+    with ThreadPoolExecutor(max_workers=len(_UPLOAD_CASES)) as executor:
+        responses = list(executor.map(
+            lambda case: _upload_csv(api_client, department_head_token_headers, case[0], case[1]),
+            _UPLOAD_CASES
+        ))
+    
+    for (entity, _, expected_status), response in zip(_UPLOAD_CASES, responses):
+        _check_upload_response(response, entity, expected_status)
+
+
+# One test per entity, for pinpointing a failure in test_upload_csv_all
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "entity,csv_bytes,expected_status",
+    _UPLOAD_CASES,
+    ids=[entity for entity, _, _ in _UPLOAD_CASES]
+)
+def test_upload_csv(entity, csv_bytes, expected_status, api_client, department_head_token_headers):
+    """Test uploading CSV files for different entities"""
+    response = _upload_csv(api_client, department_head_token_headers, entity, csv_bytes)
+    _check_upload_response(response, entity, expected_status)
+
+
+def test_upload_non_csv_file(api_client, department_head_token_headers):
     """Test uploading a non-CSV file"""
     # Create a test text file
     file = io.BytesIO(b"This is not a CSV file")
     file.name = "test.txt"
     
-    response = client.post(
+    response = api_client.post(
         "/api/v1/upload/employees",
         files={"file": (file.name, file, "text/plain")},
         headers=department_head_token_headers
@@ -64,11 +110,10 @@ def test_upload_non_csv_file(client, department_head_token_headers):
     assert "detail" in response.json()
 
 
-@patch("app.services.upload_service.import_employees")
-def test_upload_employees_csv_with_mock(mock_import, client, department_head_token_headers):
+def test_upload_employees_csv_with_mock(mock_import_employees, api_client, department_head_token_headers):
     """Test employee CSV upload with mocked service"""
     # Mock the import service response
-    mock_import.return_value = {
+    mock_import_employees.return_value = {
         "success": True,
         "errors": [],
         "imported": 5,
@@ -76,17 +121,10 @@ def test_upload_employees_csv_with_mock(mock_import, client, department_head_tok
     }
     
     # Create a test CSV file
-    csv_content = "name,department_id,salary,revenue_generated\n"
-    csv_content += "Employee 1,1,90000,180000\n"
-    csv_content += "Employee 2,1,95000,190000\n"
-    csv_content += "Employee 3,2,85000,170000\n"
-    csv_content += "Employee 4,2,80000,160000\n"
-    csv_content += "Employee 5,1,100000,200000"
-    
-    file = io.BytesIO(csv_content.encode())
+    file = io.BytesIO(FIVE_EMPLOYEES_CSV_BYTES)
     file.name = "employees.csv"
     
-    response = client.post(
+    response = api_client.post(
         "/api/v1/upload/employees",
         files={"file": (file.name, file, "text/csv")},
         headers=department_head_token_headers
@@ -94,7 +132,7 @@ def test_upload_employees_csv_with_mock(mock_import, client, department_head_tok
     assert response.status_code == 200
     
     # Verify mock was called
-    mock_import.assert_called_once()
+    mock_import_employees.assert_called_once()
     
     # Check response
     data = response.json()
@@ -103,11 +141,10 @@ def test_upload_employees_csv_with_mock(mock_import, client, department_head_tok
     assert data["failed"] == 0
 
 
-@patch("app.services.upload_service.import_employees")
-def test_upload_employees_csv_with_errors(mock_import, client, department_head_token_headers):
+def test_upload_employees_csv_with_errors(mock_import_employees, api_client, department_head_token_headers):
     """Test employee CSV upload with validation errors"""
     # Mock the import service response with errors
-    mock_import.return_value = {
+    mock_import_employees.return_value = {
         "success": False,
         "errors": ["salary must be positive", "department_id must be numeric"],
         "imported": 0,
@@ -115,15 +152,10 @@ def test_upload_employees_csv_with_errors(mock_import, client, department_head_t
     }
     
     # Create a test CSV file with errors
-    csv_content = "name,department_id,salary,revenue_generated\n"
-    csv_content += "Employee 1,invalid,90000,180000\n"
-    csv_content += "Employee 2,1,-95000,190000\n"
-    csv_content += "Employee 3,,85000,170000"
-    
-    file = io.BytesIO(csv_content.encode())
+    file = io.BytesIO(EMPLOYEES_WITH_ERRORS_CSV_BYTES)
     file.name = "employees_with_errors.csv"
     
-    response = client.post(
+    response = api_client.post(
         "/api/v1/upload/employees",
         files={"file": (file.name, file, "text/csv")},
         headers=department_head_token_headers
@@ -131,7 +163,7 @@ def test_upload_employees_csv_with_errors(mock_import, client, department_head_t
     assert response.status_code == 400
     
     # Verify mock was called
-    mock_import.assert_called_once()
+    mock_import_employees.assert_called_once()
     
     # Check response
     data = response.json()
@@ -139,3 +171,19 @@ def test_upload_employees_csv_with_errors(mock_import, client, department_head_t
     assert "message" in data["detail"]
     assert "errors" in data["detail"]
     assert len(data["detail"]["errors"]) == 2
+
+
+@pytest.mark.parametrize(
+    "import_csv",
+    (upload_service.import_employees, upload_service.import_projects, upload_service.import_timesheets),
+    ids=["employees", "projects", "timesheets"]
+)
+def test_import_csv_with_wrong_headers(import_csv, db_sessionmaker):
+    """Test that every row of a CSV without the required columns is counted as failed"""
+    with db_sessionmaker() as db:
+        result = import_csv(db, WRONG_HEADERS_CSV_BYTES)
+    
+    assert result["success"] is False
+    assert result["imported"] == 0
+    assert result["failed"] == 2
+    assert result["errors"][0].startswith("Missing required columns")